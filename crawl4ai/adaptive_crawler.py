@@ -21,7 +21,7 @@ from pathlib import Path
 from crawl4ai.async_webcrawler import AsyncWebCrawler
 from crawl4ai.async_configs import CrawlerRunConfig, LinkPreviewConfig
 from crawl4ai.models import Link, CrawlResult
-import numpy as np
+from crawl4ai.utils import run_coroutine_sync
 
 @dataclass
 class CrawlState:
@@ -82,6 +82,7 @@ class CrawlState:
     @classmethod
     def load(cls, path: Union[str, Path]) -> 'CrawlState':
         """Load state from disk"""
+        import numpy as np
         path = Path(path)
         with open(path, 'r') as f:
             state_dict = json.load(f)
@@ -621,6 +622,7 @@ class EmbeddingStrategy(CrawlStrategy):
     
     def _compute_distance_matrix(self, query_embeddings: Any, kb_embeddings: Any) -> Any:
         """Compute distance matrix using vectorized operations"""
+        import numpy as np
         
         
         if kb_embeddings is None or len(kb_embeddings) == 0:
@@ -736,6 +738,7 @@ class EmbeddingStrategy(CrawlStrategy):
     
     def compute_coverage_shape(self, query_points: Any, alpha: float = 0.5):
         """Find the minimal shape that covers all query points using alpha shape"""
+        import numpy as np
         try:
             
             
@@ -773,6 +776,7 @@ class EmbeddingStrategy(CrawlStrategy):
         
     def find_coverage_gaps(self, kb_embeddings: Any, query_embeddings: Any) -> List[Tuple[Any, float]]:
         """Calculate gap distances for all query variations using vectorized operations"""
+        import numpy as np
         
         
         gaps = []
@@ -808,6 +812,7 @@ class EmbeddingStrategy(CrawlStrategy):
         kb_embeddings: Any
     ) -> List[Tuple[Link, float]]:
         """Select links that most efficiently fill the gaps"""
+        import numpy as np
         from .utils import cosine_distance, cosine_similarity, get_text_embeddings
         
         import hashlib
@@ -923,6 +928,7 @@ class EmbeddingStrategy(CrawlStrategy):
 
     async def calculate_confidence(self, state: CrawlState) -> float:
         """Coverage-based learning score (0–1)."""
+        import numpy as np
         # Guard clauses
         if state.kb_embeddings is None or state.query_embeddings is None:
             return 0.0
@@ -1054,6 +1060,7 @@ class EmbeddingStrategy(CrawlStrategy):
         
     async def validate_coverage(self, state: CrawlState) -> float:
         """Validate coverage using held-out queries with caching"""
+        import numpy as np
         if not hasattr(self, '_validation_queries') or not self._validation_queries:
             return state.metrics.get('confidence', 0.0)
         
@@ -1090,6 +1097,7 @@ class EmbeddingStrategy(CrawlStrategy):
     
     async def should_stop(self, state: CrawlState, config: AdaptiveConfig) -> bool:
         """Stop based on learning curve convergence"""
+        import numpy as np
         confidence = state.metrics.get('confidence', 0.0)
         
         # Check if confidence is below minimum threshold (completely irrelevant)
@@ -1168,6 +1176,7 @@ class EmbeddingStrategy(CrawlStrategy):
     
     async def update_state(self, state: CrawlState, new_results: List[CrawlResult]) -> None:
         """Update embeddings and coverage metrics with deduplication"""
+        import numpy as np
         from .utils import get_text_embeddings
         
         
@@ -1809,7 +1818,8 @@ class AdaptiveCrawler:
             self.state.knowledge_base.extend(imported_results)
             
             # Update state with imported data
-            asyncio.run(self.strategy.update_state(self.state, imported_results))
+            # works from notebooks / running loops too, unlike asyncio.run
+            run_coroutine_sync(self.strategy.update_state(self.state, imported_results))
             
             print(f"Imported {len(imported_results)} documents from {filepath}")
         else:
@@ -1,5 +1,4 @@
 import os
-from typing import Union
 from .config import (
     DEFAULT_PROVIDER,
     DEFAULT_PROVIDER_API_KEY,
@@ -381,7 +380,8 @@ class BrowserConfig:
         text_mode (bool): If True, disables images and other rich content for potentially faster load times.
                           Default: False.
         light_mode (bool): Disables certain background features for performance gains. Default: False.
-        extra_args (list): Additional command-line arguments passed to the browser.
+        extra_args (list): Additional command-line arguments passed to the browser. Empty entries
+                           (e.g. from `"--flag" if cond else ""`) are dropped.
                            Default: [].
     """
 
@@ -458,7 +458,7 @@ class BrowserConfig:
         self.user_agent_generator_config = user_agent_generator_config
         self.text_mode = text_mode
         self.light_mode = light_mode
-        self.extra_args = extra_args if extra_args is not None else []
+        self.extra_args = [arg for arg in extra_args if arg] if extra_args is not None else []
         self.sleep_on_close = sleep_on_close
         self.verbose = verbose
         self.debugging_port = debugging_port
@@ -1332,11 +1332,11 @@ class CrawlerRunConfig():
     def __setattr__(self, name, value):
         """Handle attribute setting."""
         # TODO: Planning to set properties dynamically based on the __init__ signature
-        sig = inspect.signature(self.__init__)
-        all_params = sig.parameters  # Dictionary of parameter names and their details
-
-        if name in self._UNWANTED_PROPS and value is not all_params[name].default:
-            raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
+        # Only deprecated names need the (slow) signature lookup; __init__ sets many attributes
+        if name in self._UNWANTED_PROPS:
+            all_params = inspect.signature(self.__init__).parameters
+            if value is not all_params[name].default:
+                raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
         
         super().__setattr__(name, value)
 
@@ -31,6 +31,28 @@ from types import MappingProxyType
 import contextlib
 from functools import partial
 
+# kind -> (error text drawn on the fallback image, logger message template)
+SCREENSHOT_ERROR_MESSAGES: Final[Dict[str, tuple]] = {
+    "pdf": ("Failed to take PDF-based screenshot", "PDF Screenshot failed: {error}"),
+    "scroller": ("Failed to take large viewport screenshot", "Large viewport screenshot failed: {error}"),
+    "naive": ("Failed to take screenshot", "Screenshot failed: {error}"),
+}
+
+# Largest width/height libjpeg can encode; taller stitched screenshots fall back to PNG
+JPEG_MAX_DIMENSION: Final[int] = 65500
+
+
+def _encode_stitched_screenshot(image: Image.Image) -> str:
+    """Base64-encode a stitched screenshot: JPEG when it fits, PNG otherwise."""
+    buffered = BytesIO()
+    if max(image.size) <= JPEG_MAX_DIMENSION:
+        # JPEG like the segments: BMP is uncompressed, ~6MB per 1080p screen before base64
+        image.save(buffered, format="JPEG", quality=85)
+    else:
+        image.save(buffered, format="PNG")
+    return base64.b64encode(buffered.getbuffer()).decode("utf-8")
+
+
 class AsyncCrawlerStrategy(ABC):
     """
     Abstract base class for crawler strategies.
@@ -249,13 +271,12 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             css_selector = wait_for[4:].strip()
             try:
                 await page.wait_for_selector(css_selector, timeout=timeout)
-            except Error as e:
-                if "Timeout" in str(e):
-                    raise TimeoutError(
-                        f"Timeout after {timeout}ms waiting for selector '{css_selector}'"
-                    )
-                else:
-                    raise ValueError(f"Invalid CSS selector: '{css_selector}'")
+            except PlaywrightTimeoutError:
+                raise TimeoutError(
+                    f"Timeout after {timeout}ms waiting for selector '{css_selector}'"
+                )
+            except Error:
+                raise ValueError(f"Invalid CSS selector: '{css_selector}'")
         else:
             # Auto-detect based on content
             if wait_for.startswith("()") or wait_for.startswith("function"):
@@ -265,24 +286,23 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 # Assume it's a CSS selector first
                 try:
                     await page.wait_for_selector(wait_for, timeout=timeout)
-                except Error as e:
-                    if "Timeout" in str(e):
-                        raise TimeoutError(
-                            f"Timeout after {timeout}ms waiting for selector '{wait_for}'"
+                except PlaywrightTimeoutError:
+                    raise TimeoutError(
+                        f"Timeout after {timeout}ms waiting for selector '{wait_for}'"
+                    )
+                except Error:
+                    # If it's not a timeout error, it might be an invalid selector
+                    # Let's try to evaluate it as a JavaScript function as a fallback
+                    try:
+                        return await self.csp_compliant_wait(
+                            page, f"() => {{{wait_for}}}", timeout
+                        )
+                    except Error:
+                        raise ValueError(
+                            f"Invalid wait_for parameter: '{wait_for}'. "
+                            "It should be either a valid CSS selector, a JavaScript function, "
+                            "or explicitly prefixed with 'js:' or 'css:'."
                         )
-                    else:
-                        # If it's not a timeout error, it might be an invalid selector
-                        # Let's try to evaluate it as a JavaScript function as a fallback
-                        try:
-                            return await self.csp_compliant_wait(
-                                page, f"() => {{{wait_for}}}", timeout
-                            )
-                        except Error:
-                            raise ValueError(
-                                f"Invalid wait_for parameter: '{wait_for}'. "
-                                "It should be either a valid CSS selector, a JavaScript function, "
-                                "or explicitly prefixed with 'js:' or 'css:'."
-                            )
 
     async def csp_compliant_wait(
         self, page: Page, user_wait_function: str, timeout: float = 30000
@@ -1596,6 +1616,34 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             return await self.take_screenshot_scroller(page, **kwargs)
             # return await self.take_screenshot_from_pdf(await self.export_pdf(page))
 
+    def _screenshot_error_image(self, kind: str, error: Exception) -> str:
+        """
+        Log a screenshot failure and return a base64 JPEG with the error drawn on it,
+        so callers still get an image back.
+
+        Args:
+            kind (str): Key into SCREENSHOT_ERROR_MESSAGES
+            error (Exception): The exception that was raised
+
+        Returns:
+            str: Base64-encoded error image
+        """
+        prefix, log_message = SCREENSHOT_ERROR_MESSAGES[kind]
+        error_message = f"{prefix}: {str(error)}"
+        self.logger.error(
+            message=log_message,
+            tag="ERROR",
+            params={"error": error_message},
+        )
+
+        img = Image.new("RGB", (800, 600), color="black")
+        draw = ImageDraw.Draw(img)
+        font = ImageFont.load_default()
+        draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
+        buffered = BytesIO()
+        img.save(buffered, format="JPEG")
+        return base64.b64encode(buffered.getbuffer()).decode("utf-8")
+
     async def take_screenshot_from_pdf(self, pdf_data: bytes) -> str:
         """
         Convert the first page of the PDF to a screenshot.
@@ -1615,22 +1663,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             final_img = images[0].convert("RGB")
             buffered = BytesIO()
             final_img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
+            return base64.b64encode(buffered.getbuffer()).decode("utf-8")
         except Exception as e:
-            error_message = f"Failed to take PDF-based screenshot: {str(e)}"
-            self.logger.error(
-                message="PDF Screenshot failed: {error}",
-                tag="ERROR",
-                params={"error": error_message},
-            )
-            # Return error image as fallback
-            img = Image.new("RGB", (800, 600), color="black")
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
-            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
+            return self._screenshot_error_image("pdf", e)
 
     async def take_screenshot_scroller(self, page: Page, **kwargs) -> str:
         """
@@ -1701,31 +1736,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             stitched = Image.new("RGB", (segments[0].width, total_height))
             offset = 0
             for img in segments:
-                # stitched.paste(img, (0, offset))
-                stitched.paste(img.convert("RGB"), (0, offset))
+                # segments are already RGB (converted on capture)
+                stitched.paste(img, (0, offset))
                 offset += img.height
 
-            buffered = BytesIO()
-            stitched = stitched.convert("RGB")
-            stitched.save(buffered, format="BMP", quality=85)
-            encoded = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-            return encoded
+            return _encode_stitched_screenshot(stitched)
         except Exception as e:
-            error_message = f"Failed to take large viewport screenshot: {str(e)}"
-            self.logger.error(
-                message="Large viewport screenshot failed: {error}",
-                tag="ERROR",
-                params={"error": error_message},
-            )
-            # return error image
-            img = Image.new("RGB", (800, 600), color="black")
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
-            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
+            return self._screenshot_error_image("scroller", e)
         # finally:
         #     await page.close()
 
@@ -1744,22 +1761,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             screenshot = await page.screenshot(full_page=False)
             return base64.b64encode(screenshot).decode("utf-8")
         except Exception as e:
-            error_message = f"Failed to take screenshot: {str(e)}"
-            self.logger.error(
-                message="Screenshot failed: {error}",
-                tag="ERROR",
-                params={"error": error_message},
-            )
-
-            # Generate an error image
-            img = Image.new("RGB", (800, 600), color="black")
-            draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
-            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
-
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG")
-            return base64.b64encode(buffered.getvalue()).decode("utf-8")
+            return self._screenshot_error_image("naive", e)
         # finally:
         #     await page.close()
 
@@ -2190,6 +2192,26 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 # HTTP Crawler Strategy
 ####################################################################################################
 
+def _accept_encoding() -> str:
+    """Advertise every content coding aiohttp can decode in this environment."""
+    encodings = ["gzip", "deflate"]
+    try:
+        from aiohttp.compression_utils import HAS_BROTLI
+    except ImportError:
+        HAS_BROTLI = False
+    try:
+        from aiohttp.compression_utils import HAS_ZSTD
+    except ImportError:
+        HAS_ZSTD = False
+    # br/zstd bodies are typically 15-25% smaller than gzip, but advertising
+    # them without a decoder installed makes every such response fail
+    if HAS_ZSTD:
+        encodings.append("zstd")
+    if HAS_BROTLI:
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
 class HTTPCrawlerError(Exception):
     """Base error class for HTTP crawler specific exceptions"""
     pass
@@ -2210,9 +2232,14 @@ class HTTPStatusError(HTTPCrawlerError):
 class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Fast, lightweight HTTP-only crawler strategy optimized for memory efficiency.
+
+    Response bodies are read in full by default. Pass ``max_response_size`` (bytes)
+    to cap them: a larger Content-Length is rejected before the body is read, and a
+    streamed body is abandoned as soon as it passes the limit. Both raise
+    HTTPCrawlerError.
     """
     
-    __slots__ = ('logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config')
+    __slots__ = ('logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', 'max_response_size', '_session', 'hooks', 'browser_config')
 
     DEFAULT_TIMEOUT: Final[int] = 30
     DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024  
@@ -2223,7 +2250,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     _BASE_HEADERS: Final = MappingProxyType({
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
+        'Accept-Encoding': _accept_encoding(),
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -2235,7 +2262,8 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         logger: Optional[AsyncLogger] = None,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
         dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
-        chunk_size: int = DEFAULT_CHUNK_SIZE
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_response_size: Optional[int] = None
     ):
         """Initialize the HTTP crawler with config"""
         self.browser_config = browser_config or HTTPCrawlerConfig()
@@ -2243,6 +2271,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         self.max_connections = max_connections
         self.dns_cache_ttl = dns_cache_ttl
         self.chunk_size = chunk_size
+        self.max_response_size = max_response_size
         self._session: Optional[aiohttp.ClientSession] = None
         
         self.hooks = {
@@ -2343,6 +2372,24 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         )
 
 
+    async def _read_body(self, response: aiohttp.ClientResponse, url: str) -> bytes:
+        """Stream the response body in chunks, bailing out once it exceeds max_response_size."""
+        limit = self.max_response_size
+        if limit is None:
+            return await response.read()
+        if response.content_length is not None and response.content_length > limit:
+            raise HTTPCrawlerError(
+                f"Response from {url} is {response.content_length} bytes, over the {limit} byte limit"
+            )
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(self.chunk_size):
+            body.extend(chunk)
+            if len(body) > limit:
+                raise HTTPCrawlerError(
+                    f"Response from {url} exceeded the {limit} byte limit"
+                )
+        return bytes(body)
+
     async def _handle_http(
         self, 
         url: str, 
@@ -2376,7 +2423,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
 
             try:
                 async with session.request(self.browser_config.method, url, **request_kwargs) as response:
-                    content = memoryview(await response.read())
+                    content = memoryview(await self._read_body(response, url))
                     
                     if not (200 <= response.status < 300):
                         raise HTTPStatusError(
@@ -2,6 +2,8 @@ import os
 from pathlib import Path
 import aiosqlite
 import asyncio
+import random
+import sqlite3
 from typing import Optional, Dict
 from contextlib import asynccontextmanager
 import json  
@@ -19,6 +21,19 @@ base_directory = DB_PATH = os.path.join(
 os.makedirs(DB_PATH, exist_ok=True)
 DB_PATH = os.path.join(base_directory, "crawl4ai.db")
 
+# Primary SQLite result codes a retry can recover from (sqlite3 only names them on 3.11+)
+_SQLITE_BUSY, _SQLITE_LOCKED = 5, 6
+
+
+def _is_transient_sqlite_error(error: sqlite3.OperationalError) -> bool:
+    """True for "database is locked" / busy errors; schema errors etc. won't go away on retry."""
+    code = getattr(error, "sqlite_errorcode", None)  # Python 3.11+
+    if code is not None:
+        # extended codes (e.g. SQLITE_BUSY_SNAPSHOT) carry the primary code in the low byte
+        return code & 0xFF in (_SQLITE_BUSY, _SQLITE_LOCKED)
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
 
 class AsyncDatabaseManager:
     def __init__(self, pool_size: int = 10, max_retries: int = 3):
@@ -213,7 +228,10 @@ class AsyncDatabaseManager:
                     result = await operation(db, *args)
                     await db.commit()
                     return result
-            except Exception as e:
+            except sqlite3.OperationalError as e:
+                # Only "database is locked" / busy is transient; anything else fails now
+                if not _is_transient_sqlite_error(e):
+                    raise
                 if attempt == self.max_retries - 1:
                     self.logger.error(
                         message="Operation failed after {retries} attempts: {error}",
@@ -222,7 +240,9 @@ class AsyncDatabaseManager:
                         params={"retries": self.max_retries, "error": str(e)},
                     )
                     raise
-                await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
+                # Exponential backoff with jitter so concurrent writers don't retry in lockstep
+                delay = min(0.5 * (2 ** attempt), 8.0)
+                await asyncio.sleep(delay + random.uniform(0, 0.5 * delay))
 
     async def ainit_db(self):
         """Initialize database schema"""
@@ -529,13 +549,15 @@ class AsyncDatabaseManager:
         if not content:
             return ""
 
-        content_hash = generate_content_hash(content)
+        # Encode once and reuse the bytes for hashing and writing (screenshots can be MBs)
+        data = content.encode("utf-8")
+        content_hash = generate_content_hash(data)
         file_path = os.path.join(self.content_paths[content_type], content_hash)
 
         # Only write if file doesn't exist
         if not os.path.exists(file_path):
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                await f.write(content)
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(data)
 
         return content_hash
 
@@ -13,6 +13,7 @@ from .types import AsyncWebCrawler
 
 from collections.abc import AsyncGenerator
 
+import sys
 import time
 import psutil
 import asyncio
@@ -23,6 +24,17 @@ import random
 from abc import ABC, abstractmethod
 
 
+if sys.version_info >= (3, 11):
+    async def _queue_get(queue: asyncio.Queue, timeout: float):
+        # asyncio.timeout() runs in the current task instead of wrapping
+        # queue.get() in a new one, as wait_for() does on every poll.
+        async with asyncio.timeout(timeout):
+            return await queue.get()
+else:
+    async def _queue_get(queue: asyncio.Queue, timeout: float):
+        return await asyncio.wait_for(queue.get(), timeout=timeout)
+
+
 class RateLimiter:
     def __init__(
         self,
@@ -352,9 +364,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 if not self.memory_pressure_mode and len(active_tasks) < self.max_session_permit:
                     try:
                         # Try to get a task with timeout to avoid blocking indefinitely
-                        priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
-                            self.task_queue.get(), timeout=0.1
-                        )
+                        priority, (url, task_id, retry_count, enqueue_time) = await _queue_get(self.task_queue, 0.1)
                         
                         # Create and start the task
                         task = asyncio.create_task(
@@ -422,9 +432,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             while not self.task_queue.empty() and time.time() - drain_start < 5.0:  # 5 second safety timeout
                 try:
                     # Get item from queue with timeout
-                    priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=0.1
-                    )
+                    priority, (url, task_id, retry_count, enqueue_time) = await _queue_get(self.task_queue, 0.1)
                     
                     # Calculate new priority based on current wait time
                     current_time = time.time()
@@ -504,9 +512,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 if not self.memory_pressure_mode and len(active_tasks) < self.max_session_permit:
                     try:
                         # Try to get a task with timeout
-                        priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
-                            self.task_queue.get(), timeout=0.1
-                        )
+                        priority, (url, task_id, retry_count, enqueue_time) = await _queue_get(self.task_queue, 0.1)
                         
                         # Create and start the task
                         task = asyncio.create_task(
@@ -18,6 +18,7 @@ import aiofiles
 import asyncio
 import gzip
 import hashlib
+import importlib.util
 import io
 import json
 import os
@@ -42,11 +43,9 @@ try:
     HAS_BROTLI = True
 except ImportError:
     HAS_BROTLI = False
-try:
-    import rank_bm25
-    HAS_BM25 = True
-except ImportError:
-    HAS_BM25 = False
+# Probe without importing: rank_bm25 drags numpy in, and it is only
+# needed once BM25 scoring actually runs
+HAS_BM25 = importlib.util.find_spec("rank_bm25") is not None
 
 # Import AsyncLoggerBase from crawl4ai's logger module
 # Assuming crawl4ai/async_logger.py defines AsyncLoggerBase
@@ -676,9 +675,9 @@ class AsyncUrlSeeder:
         
         return results
 
-    async def _resolve_head(self, url: str) -> Optional[str]:
+    async def _resolve_head(self, url: str, timeout: int = 10) -> Optional[str]:
         """
-        HEAD-probe a URL.
+        HEAD-probe a URL, waiting at most ``timeout`` seconds.
 
         Returns:
             * the same URL if it answers 2xx,
@@ -686,7 +685,7 @@ class AsyncUrlSeeder:
             * None on any other status or network error.
         """
         try:
-            r = await self.client.head(url, timeout=10, follow_redirects=False)
+            r = await self.client.head(url, timeout=timeout, follow_redirects=False)
 
             # direct hit
             if 200 <= r.status_code < 300:
@@ -996,7 +995,7 @@ class AsyncUrlSeeder:
         elif live:
             self._log("debug", "Performing live check for {url}", params={
                       "url": url}, tag="URL_SEED")
-            ok = await self._resolve_head(url)
+            ok = await self._resolve_head(url, timeout)
             status = "valid" if ok else "not_valid"
             self._log("info" if ok else "warning", "LIVE CHECK {status} for {url}",
                       params={"status": status.upper(), "url": url}, tag="URL_SEED")
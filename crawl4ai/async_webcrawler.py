@@ -189,6 +189,7 @@ class AsyncWebCrawler:
         2. Close any open pages and contexts
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        await self.robots_parser.close()
 
     async def __aenter__(self):
         return await self.start()
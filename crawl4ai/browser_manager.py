@@ -1,4 +1,5 @@
 import asyncio
+import re
 import time
 from typing import List, Optional
 import os
@@ -8,7 +9,6 @@ import tempfile
 import psutil  
 import signal
 import subprocess
-import shlex
 from playwright.async_api import BrowserContext
 import hashlib
 from .js_snippet import load_js_script
@@ -17,6 +17,98 @@ from .async_configs import BrowserConfig, CrawlerRunConfig
 from .utils import get_chromium_path
 
 
+# Launch flags shared by every Chromium start (Playwright launch and managed/CDP browser)
+BROWSER_BASE_ARGS = (
+    "--disable-gpu",
+    "--disable-gpu-compositing",
+    "--disable-software-rasterizer",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-infobars",
+    "--window-position=0,0",
+    "--ignore-certificate-errors",
+    "--ignore-certificate-errors-spki-list",
+    "--disable-blink-features=AutomationControlled",
+    "--window-position=400,0",
+    "--disable-renderer-backgrounding",
+    "--disable-ipc-flooding-protection",
+    "--force-color-profile=srgb",
+    "--mute-audio",
+    "--disable-background-timer-throttling",
+)
+
+# Extra flags applied when BrowserConfig.text_mode is enabled
+BROWSER_TEXT_MODE_OPTIONS = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+    "--disable-javascript",
+    "--disable-software-rasterizer",
+    "--disable-dev-shm-usage",
+)
+
+# Static assets aborted when BrowserConfig.text_mode is on
+BLOCKED_EXTENSIONS = [
+    # Images
+    "jpg",
+    "jpeg",
+    "png",
+    "gif",
+    "webp",
+    "svg",
+    "ico",
+    "bmp",
+    "tiff",
+    "psd",
+    # Fonts
+    "woff",
+    "woff2",
+    "ttf",
+    "otf",
+    "eot",
+    # Styles
+    # 'css', 'less', 'scss', 'sass',
+    # Media
+    "mp4",
+    "webm",
+    "ogg",
+    "avi",
+    "mov",
+    "wmv",
+    "flv",
+    "m4v",
+    "mp3",
+    "wav",
+    "aac",
+    "m4a",
+    "opus",
+    "flac",
+    # Documents
+    "pdf",
+    "doc",
+    "docx",
+    "xls",
+    "xlsx",
+    "ppt",
+    "pptx",
+    # Archives
+    "zip",
+    "rar",
+    "7z",
+    "tar",
+    "gz",
+    # Scripts and data
+    "xml",
+    "swf",
+    "wasm",
+]
+
+# One route pattern for all of them; also matches URLs carrying a ?query or #fragment
+BLOCKED_EXTENSIONS_PATTERN = re.compile(
+    r"\.(?:" + "|".join(BLOCKED_EXTENSIONS) + r")(?:[?#].*)?$", re.IGNORECASE
+)
+
 BROWSER_DISABLE_OPTIONS = [
     "--disable-background-networking",
     "--disable-background-timer-throttling",
@@ -68,37 +160,11 @@ class ManagedBrowser:
     @staticmethod
     def build_browser_flags(config: BrowserConfig) -> List[str]:
         """Common CLI flags for launching Chromium"""
-        flags = [
-            "--disable-gpu",
-            "--disable-gpu-compositing",
-            "--disable-software-rasterizer",
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--disable-infobars",
-            "--window-position=0,0",
-            "--ignore-certificate-errors",
-            "--ignore-certificate-errors-spki-list",
-            "--disable-blink-features=AutomationControlled",
-            "--window-position=400,0",
-            "--disable-renderer-backgrounding",
-            "--disable-ipc-flooding-protection",
-            "--force-color-profile=srgb",
-            "--mute-audio",
-            "--disable-background-timer-throttling",
-        ]
+        flags = list(BROWSER_BASE_ARGS)
         if config.light_mode:
             flags.extend(BROWSER_DISABLE_OPTIONS)
         if config.text_mode:
-            flags.extend([
-                "--blink-settings=imagesEnabled=false",
-                "--disable-remote-fonts",
-                "--disable-images",
-                "--disable-javascript",
-                "--disable-software-rasterizer",
-                "--disable-dev-shm-usage",
-            ])
+            flags.extend(BROWSER_TEXT_MODE_OPTIONS)
         # proxy support
         if config.proxy:
             flags.append(f"--proxy-server={config.proxy}")
@@ -156,34 +222,12 @@ class ManagedBrowser:
         self.shutting_down = False
         self.cdp_url = browser_config.cdp_url
         self.browser_config = browser_config
+        # Running Playwright instance the owner may lend us, so resolving the
+        # browser executable does not spawn a second driver process
+        self.playwright = None
 
-    async def start(self) -> str:
-        """
-        Starts the browser process or returns CDP endpoint URL.
-        If cdp_url is provided, returns it directly.
-        If user_data_dir is not provided for local browser, creates a temporary directory.
-        
-        Returns:
-            str: CDP endpoint URL
-        """
-        # If CDP URL provided, just return it
-        if self.cdp_url:
-            return self.cdp_url
-
-        # Create temp dir if needed
-        if not self.user_data_dir:
-            self.temp_dir = tempfile.mkdtemp(prefix="browser-profile-")
-            self.user_data_dir = self.temp_dir
-
-        # Get browser path and args based on OS and browser type
-        # browser_path = self._get_browser_path()
-        args = await self._get_browser_args()
-        
-        if self.browser_config.extra_args:
-            args.extend(self.browser_config.extra_args)
-            
-
-        # ── make sure no old Chromium instance is owning the same port/profile ──
+    def _cleanup_stale_browser(self):
+        """Kill any Chromium still holding our debugging port and drop its profile locks."""
         try:
             if sys.platform == "win32":
                 if psutil is None:
@@ -197,13 +241,13 @@ class ManagedBrowser:
                         p.kill()
                         p.wait(timeout=5)
             else:  # macOS / Linux
-                # kill any process listening on the same debugging port
-                pids = (
-                    subprocess.check_output(shlex.split(f"lsof -t -i:{self.debugging_port}"))
-                    .decode()
-                    .strip()
-                    .splitlines()
-                )
+                # kill any process listening on the same debugging port; lsof
+                # exits 1 when there is none, which must not skip the lock cleanup
+                pids = subprocess.run(
+                    ["lsof", "-t", f"-i:{self.debugging_port}"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                ).stdout.decode().split()
                 for pid in pids:
                     try:
                         os.kill(int(pid), signal.SIGTERM)
@@ -218,7 +262,37 @@ class ManagedBrowser:
                         os.remove(fp)
         except Exception as _e:
             # non-fatal — we'll try to start anyway, but log what happened
-            self.logger.warning(f"pre-launch cleanup failed: {_e}", tag="BROWSER")            
+            self.logger.warning(f"pre-launch cleanup failed: {_e}", tag="BROWSER")
+
+    async def start(self) -> str:
+        """
+        Starts the browser process or returns CDP endpoint URL.
+        If cdp_url is provided, returns it directly.
+        If user_data_dir is not provided for local browser, creates a temporary directory.
+        
+        Returns:
+            str: CDP endpoint URL
+        """
+        # If CDP URL provided, just return it
+        if self.cdp_url:
+            return self.cdp_url
+
+        # Create temp dir if needed
+        if not self.user_data_dir:
+            self.temp_dir = tempfile.mkdtemp(prefix="browser-profile-")
+            self.user_data_dir = self.temp_dir
+
+        # Get browser path and args based on OS and browser type
+        # browser_path = self._get_browser_path()
+        args = await self._get_browser_args()
+        
+        if self.browser_config.extra_args:
+            args.extend(self.browser_config.extra_args)
+            
+
+        # ── make sure no old Chromium instance is owning the same port/profile ──
+        # (lsof / process waits are blocking, keep them off the event loop)
+        await asyncio.to_thread(self._cleanup_stale_browser)
             
 
         # Start browser process
@@ -250,12 +324,36 @@ class ManagedBrowser:
             # We'll monitor for a short time to make sure it starts properly, but won't keep monitoring
             await asyncio.sleep(0.5)  # Give browser time to start
             await self._initial_startup_check()
-            await asyncio.sleep(2)  # Give browser time to start
-            return f"http://{self.host}:{self.debugging_port}"
+            cdp_url = f"http://{self.host}:{self.debugging_port}"
+            await self._wait_for_cdp(cdp_url)
+            return cdp_url
         except Exception as e:
             await self.cleanup()
             raise Exception(f"Failed to start browser: {e}")
 
+    async def _wait_for_cdp(self, cdp_url: str, timeout: float = 2.0):
+        """
+        Wait until the DevTools endpoint answers, for at most ``timeout`` seconds.
+
+        Replaces a fixed sleep of the same length: the caller connects over CDP as
+        soon as the browser accepts connections instead of always waiting it out.
+        """
+        import aiohttp
+
+        deadline = time.monotonic() + timeout
+        async with aiohttp.ClientSession() as session:
+            while time.monotonic() < deadline:
+                try:
+                    async with session.get(
+                        f"{cdp_url}/json/version",
+                        timeout=aiohttp.ClientTimeout(total=0.5),
+                    ) as response:
+                        if response.status == 200:
+                            return
+                except Exception:
+                    pass
+                await asyncio.sleep(0.1)
+
     async def _initial_startup_check(self):
         """
         Perform a quick check to make sure the browser started successfully.
@@ -355,7 +453,7 @@ class ManagedBrowser:
         return paths.get(self.browser_type)
 
     async def _get_browser_path(self) -> str:
-        browser_path = await get_chromium_path(self.browser_type)
+        browser_path = await get_chromium_path(self.browser_type, self.playwright)
         return browser_path
 
     async def _get_browser_args(self) -> List[str]:
@@ -406,7 +504,9 @@ class ManagedBrowser:
                         if sys.platform == "win32":
                             # On Windows we might need taskkill for detached processes
                             try:
-                                subprocess.run(["taskkill", "/F", "/PID", str(self.browser_process.pid)])
+                                await asyncio.to_thread(
+                                    subprocess.run, ["taskkill", "/F", "/PID", str(self.browser_process.pid)]
+                                )
                             except Exception:
                                 self.browser_process.kill()
                         else:
@@ -422,7 +522,8 @@ class ManagedBrowser:
 
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
-                shutil.rmtree(self.temp_dir)
+                # a Chromium profile is thousands of files; don't stall the loop deleting it
+                await asyncio.to_thread(shutil.rmtree, self.temp_dir)
             except Exception as e:
                 self.logger.error(
                     message="Error removing temporary directory: {error}",
@@ -636,6 +737,8 @@ class BrowserManager:
 
         if self.config.cdp_url or self.config.use_managed_browser:
             self.config.use_managed_browser = True
+            if self.managed_browser is not None:
+                self.managed_browser.playwright = self.playwright
             cdp_url = await self.managed_browser.start() if not self.config.cdp_url else self.config.cdp_url
             self.browser = await self.playwright.chromium.connect_over_cdp(cdp_url)
             contexts = self.browser.contexts
@@ -661,25 +764,7 @@ class BrowserManager:
     def _build_browser_args(self) -> dict:
         """Build browser launch arguments from config."""
         args = [
-            "--disable-gpu",
-            "--disable-gpu-compositing",
-            "--disable-software-rasterizer",
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--disable-infobars",
-            "--window-position=0,0",
-            "--ignore-certificate-errors",
-            "--ignore-certificate-errors-spki-list",
-            "--disable-blink-features=AutomationControlled",
-            "--window-position=400,0",
-            "--disable-renderer-backgrounding",
-            "--disable-ipc-flooding-protection",
-            "--force-color-profile=srgb",
-            "--mute-audio",
-            "--disable-background-timer-throttling",
-            # "--single-process",
+            *BROWSER_BASE_ARGS,
             f"--window-size={self.config.viewport_width},{self.config.viewport_height}",
         ]
 
@@ -687,16 +772,7 @@ class BrowserManager:
             args.extend(BROWSER_DISABLE_OPTIONS)
 
         if self.config.text_mode:
-            args.extend(
-                [
-                    "--blink-settings=imagesEnabled=false",
-                    "--disable-remote-fonts",
-                    "--disable-images",
-                    "--disable-javascript",
-                    "--disable-software-rasterizer",
-                    "--disable-dev-shm-usage",
-                ]
-            )
+            args.extend(BROWSER_TEXT_MODE_OPTIONS)
 
         if self.config.extra_args:
             args.extend(self.config.extra_args)
@@ -830,60 +906,6 @@ class BrowserManager:
         }
         proxy_settings = {"server": self.config.proxy} if self.config.proxy else None
 
-        blocked_extensions = [
-            # Images
-            "jpg",
-            "jpeg",
-            "png",
-            "gif",
-            "webp",
-            "svg",
-            "ico",
-            "bmp",
-            "tiff",
-            "psd",
-            # Fonts
-            "woff",
-            "woff2",
-            "ttf",
-            "otf",
-            "eot",
-            # Styles
-            # 'css', 'less', 'scss', 'sass',
-            # Media
-            "mp4",
-            "webm",
-            "ogg",
-            "avi",
-            "mov",
-            "wmv",
-            "flv",
-            "m4v",
-            "mp3",
-            "wav",
-            "aac",
-            "m4a",
-            "opus",
-            "flac",
-            # Documents
-            "pdf",
-            "doc",
-            "docx",
-            "xls",
-            "xlsx",
-            "ppt",
-            "pptx",
-            # Archives
-            "zip",
-            "rar",
-            "7z",
-            "tar",
-            "gz",
-            # Scripts and data
-            "xml",
-            "swf",
-            "wasm",
-        ]
 
         # Common context settings
         context_settings = {
@@ -940,9 +962,8 @@ class BrowserManager:
 
         # Apply text mode settings if enabled
         if self.config.text_mode:
-            # Create and apply route patterns for each extension
-            for ext in blocked_extensions:
-                await context.route(f"**/*.{ext}", lambda route: route.abort())
+            # Single route for every blocked extension (was one route per extension)
+            await context.route(BLOCKED_EXTENSIONS_PATTERN, lambda route: route.abort())
         return context
 
     def _make_config_signature(self, crawlerRunConfig: CrawlerRunConfig) -> str:
@@ -1068,12 +1089,23 @@ class BrowserManager:
         if self.config.sleep_on_close:
             await asyncio.sleep(0.5)
 
+        # Each close is a round trip to the browser and they don't depend on one
+        # another, so issue them together instead of one after the other
         session_ids = list(self.sessions.keys())
-        for session_id in session_ids:
-            await self.kill_session(session_id)
+        results = await asyncio.gather(
+            *(self.kill_session(sid) for sid in session_ids), return_exceptions=True
+        )
+        for sid, result in zip(session_ids, results):
+            if isinstance(result, Exception):
+                self.sessions.pop(sid, None)
+                self.logger.error(
+                    message="Error killing session {session_id}: {error}",
+                    tag="ERROR",
+                    params={"session_id": sid, "error": str(result)}
+                )
 
         # Now close all contexts we created. This reclaims memory from ephemeral contexts.
-        for ctx in self.contexts_by_config.values():
+        async def _close_context(ctx):
             try:
                 await ctx.close()
             except Exception as e:
@@ -1082,6 +1114,8 @@ class BrowserManager:
                     tag="ERROR",
                     params={"error": str(e)}
                 )
+
+        await asyncio.gather(*(_close_context(ctx) for ctx in self.contexts_by_config.values()))
         self.contexts_by_config.clear()
 
         if self.browser:
@@ -13,6 +13,7 @@ import datetime
 import uuid
 import shutil
 import json
+import psutil
 import subprocess
 import time
 from typing import List, Dict, Optional, Any
@@ -941,9 +942,8 @@ class BrowserProfiler:
         try:
             # Check if the process exists
             if sys.platform == "win32":
-                process = subprocess.run(["tasklist", "/FI", f"PID eq {pid}"], 
-                                         capture_output=True, text=True)
-                return str(pid) in process.stdout
+                # psutil asks the OS directly; spawning tasklist took ~100 ms per poll
+                return psutil.pid_exists(pid)
             else:
                 # Unix-like systems
                 os.kill(pid, 0)  # This doesn't actually kill the process, just checks if it exists
@@ -969,7 +969,9 @@ class BrowserProfiler:
             
         try:
             if sys.platform == "win32":
-                subprocess.run(["taskkill", "/F", "/PID", str(pid)], check=True)
+                await asyncio.to_thread(
+                    subprocess.run, ["taskkill", "/F", "/PID", str(pid)], check=True
+                )
             else:
                 os.kill(pid, signal.SIGTERM)
                 # Wait for termination
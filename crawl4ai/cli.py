@@ -4,6 +4,7 @@ import sys
 import time
 
 import humanize
+import importlib.util
 from typing import Dict, Any, Optional, List
 import json
 import yaml
@@ -40,6 +41,10 @@ from pathlib import Path
 # Initialize rich console
 console = Console()
 
+# Run the crawl on uvloop when it is installed (the Docker server already does,
+# via uvicorn's loop="auto"); it is optional and never available on Windows
+_ANYIO_BACKEND_OPTIONS = {"use_uvloop": True} if importlib.util.find_spec("uvloop") else {}
+
 def get_global_config() -> dict:
     config_dir = Path.home() / ".crawl4ai"
     config_file = config_dir / "global.yml"
@@ -1193,7 +1198,8 @@ Always return valid, properly formatted JSON."""
             url,
             browser_cfg,
             crawler_cfg,
-            verbose
+            verbose,
+            backend_options=_ANYIO_BACKEND_OPTIONS,
         )
 
         # Handle deep crawl results (list) vs single result
@@ -1213,7 +1219,8 @@ Always return valid, properly formatted JSON."""
         if question:
             provider, token = setup_llm_config()
             markdown = main_result.markdown.raw_markdown
-            anyio.run(stream_llm_response, url, markdown, question, provider, token)
+            anyio.run(stream_llm_response, url, markdown, question, provider, token,
+                      backend_options=_ANYIO_BACKEND_OPTIONS)
             return
         
         # Handle output
@@ -4,7 +4,6 @@ import threading
 import psutil
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
-import threading
 from rich.console import Console
 from rich.layout import Layout
 from rich.panel import Panel
@@ -3,7 +3,6 @@ import re
 import time
 from bs4 import BeautifulSoup, Tag
 from typing import List, Tuple, Dict, Optional
-from rank_bm25 import BM25Okapi
 from collections import deque
 from bs4 import NavigableString, Comment
 
@@ -20,7 +19,6 @@ from .types import LLMConfig
 from .config import DEFAULT_PROVIDER, OVERLAP_RATE, WORD_TOKEN_RATE
 from abc import ABC, abstractmethod
 import math
-from snowballstemmer import stemmer
 from .models import TokenUsage
 from .prompts import PROMPT_FILTER_CONTENT
 import json
@@ -30,6 +28,46 @@ from concurrent.futures import ThreadPoolExecutor
 from .async_logger import AsyncLogger, LogLevel, LogColor
 
 
+# Tags to ignore - inline elements that shouldn't break text flow
+_INLINE_TAGS = frozenset({
+    "a",
+    "abbr",
+    "acronym",
+    "b",
+    "bdo",
+    "big",
+    "br",
+    "button",
+    "cite",
+    "code",
+    "dfn",
+    "em",
+    "i",
+    "img",
+    "input",
+    "kbd",
+    "label",
+    "map",
+    "object",
+    "q",
+    "samp",
+    "script",
+    "select",
+    "small",
+    "span",
+    "strong",
+    "sub",
+    "sup",
+    "textarea",
+    "time",
+    "tt",
+    "var",
+})
+
+# Tags that typically contain meaningful headers
+_HEADER_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6", "header"})
+
+
 class RelevantContentFilter(ABC):
     """Abstract base class for content filtering strategies"""
 
@@ -137,23 +175,25 @@ class RelevantContentFilter(ABC):
         except Exception:
             pass
 
-        if soup.find("h1"):
-            query_parts.append(soup.find("h1").get_text())
+        h1 = soup.find("h1")
+        if h1:
+            query_parts.append(h1.get_text())
 
         # Meta tags
-        temp = ""
+        has_meta = False
         for meta_name in ["keywords", "description"]:
             meta = soup.find("meta", attrs={"name": meta_name})
             if meta and meta.get("content"):
                 query_parts.append(meta["content"])
-                temp += meta["content"]
+                has_meta = True
 
         # If still empty, grab first significant paragraph
-        if not temp:
+        if not has_meta:
             # Find the first tag P thatits text contains more than 50 characters
             for p in body.find_all("p"):
-                if len(p.get_text()) > 150:
-                    query_parts.append(p.get_text()[:150])
+                p_text = p.get_text()
+                if len(p_text) > 150:
+                    query_parts.append(p_text[:150])
                     break
 
         return " ".join(filter(None, query_parts))
@@ -171,44 +211,8 @@ class RelevantContentFilter(ABC):
         Returns:
             List of (text, tag_name) tuples
         """
-        # Tags to ignore - inline elements that shouldn't break text flow
-        INLINE_TAGS = {
-            "a",
-            "abbr",
-            "acronym",
-            "b",
-            "bdo",
-            "big",
-            "br",
-            "button",
-            "cite",
-            "code",
-            "dfn",
-            "em",
-            "i",
-            "img",
-            "input",
-            "kbd",
-            "label",
-            "map",
-            "object",
-            "q",
-            "samp",
-            "script",
-            "select",
-            "small",
-            "span",
-            "strong",
-            "sub",
-            "sup",
-            "textarea",
-            "time",
-            "tt",
-            "var",
-        }
-
-        # Tags that typically contain meaningful headers
-        HEADER_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6", "header"}
+        INLINE_TAGS = _INLINE_TAGS
+        HEADER_TAGS = _HEADER_TAGS
 
         chunks = []
         current_text = []
@@ -240,8 +244,9 @@ class RelevantContentFilter(ABC):
                 continue
 
             if isinstance(element, NavigableString):
-                if str(element).strip():
-                    current_text.append(str(element).strip())
+                stripped = element.strip()
+                if stripped:
+                    current_text.append(stripped)
                 continue
 
             # Pre-allocate children to avoid multiple list operations
@@ -265,7 +270,9 @@ class RelevantContentFilter(ABC):
 
         if min_word_threshold:
             chunks = [
-                chunk for chunk in chunks if len(chunk[1].split()) >= min_word_threshold
+                chunk
+                for chunk in chunks
+                if len(chunk[1].split(None, min_word_threshold)) >= min_word_threshold
             ]
 
         return chunks
@@ -435,7 +442,11 @@ class BM25ContentFilter(RelevantContentFilter):
             "pre": 1.5,
             "th": 1.5,  # Table headers
         }
-        self.stemmer = stemmer(language) if use_stemming else None
+        self.stemmer = None
+        if use_stemming:
+            from snowballstemmer import stemmer
+
+            self.stemmer = stemmer(language)
 
     def filter_content(self, html: str, min_word_threshold: int = None) -> List[str]:
         """
@@ -504,6 +515,9 @@ class BM25ContentFilter(RelevantContentFilter):
         tokenized_corpus = [clean_tokens(tokens) for tokens in tokenized_corpus]
         tokenized_query = clean_tokens(tokenized_query)
 
+        # rank_bm25 pulls in numpy, so only import it once BM25 filtering runs
+        from rank_bm25 import BM25Okapi
+
         bm25 = BM25Okapi(tokenized_corpus)
         scores = bm25.get_scores(tokenized_query)
 
@@ -866,11 +880,11 @@ class LLMContentFilter(RelevantContentFilter):
     def __setattr__(self, name, value):
         """Handle attribute setting."""
         # TODO: Planning to set properties dynamically based on the __init__ signature
-        sig = inspect.signature(self.__init__)
-        all_params = sig.parameters  # Dictionary of parameter names and their details
-
-        if name in self._UNWANTED_PROPS and value is not all_params[name].default:
-            raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
+        # Only deprecated names need the (slow) signature lookup; __init__ sets many attributes
+        if name in self._UNWANTED_PROPS:
+            all_params = inspect.signature(self.__init__).parameters
+            if value is not all_params[name].default:
+                raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
         
         super().__setattr__(name, value)  
         
@@ -25,6 +25,7 @@ from .utils import (
     extract_metadata_using_lxml,
     extract_page_context,
     calculate_link_intrinsic_score,
+    run_coroutine_sync,
 )
 from lxml import etree
 from lxml import html as lhtml
@@ -380,14 +381,28 @@ class WebScrapingStrategy(ContentScrapingStrategy):
         image_description_min_word_threshold = kwargs.get(
             "image_description_min_word_threshold", IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD
         )
+        # Sibling images share most of their ancestors, so when the caller
+        # passes a cache the text of each ancestor is extracted only once.
+        text_cache = kwargs.get("parent_text_cache")
         current_tag = tag
         while current_tag:
             current_tag = current_tag.parent
             # Get the text content of the parent tag
             if current_tag:
-                text_content = current_tag.get_text(separator=" ", strip=True)
-                # Check if the text content has at least word_count_threshold
-                if len(text_content.split()) >= image_description_min_word_threshold:
+                key = id(current_tag)
+                if text_cache is not None and key in text_cache:
+                    text_content = text_cache[key]
+                else:
+                    text_content = current_tag.get_text(separator=" ", strip=True)
+                    # Check if the text content has at least word_count_threshold
+                    if (
+                        len(text_content.split(None, image_description_min_word_threshold))
+                        < image_description_min_word_threshold
+                    ):
+                        text_content = None
+                    if text_cache is not None:
+                        text_cache[key] = text_content
+                if text_content is not None:
                     return text_content
         return None
 
@@ -825,7 +840,9 @@ class WebScrapingStrategy(ContentScrapingStrategy):
                 "word_count_threshold", MIN_WORD_THRESHOLD
             )
             if not keep_element:
-                word_count = len(element.get_text(strip=True).split())
+                word_count = len(
+                    element.get_text(strip=True).split(None, word_count_threshold)
+                )
                 keep_element = word_count >= word_count_threshold
 
             if not keep_element:
@@ -984,18 +1001,8 @@ class WebScrapingStrategy(ContentScrapingStrategy):
                     async with LinkPreview(self.logger) as extractor:
                         return await extractor.extract_link_heads(links_obj, config)
                 
-                # Run the async operation
-                try:
-                    # Check if we're already in an async context
-                    loop = asyncio.get_running_loop()
-                    # If we're in an async context, we need to run in a thread
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, extract_links())
-                        updated_links = future.result()
-                except RuntimeError:
-                    # No running loop, we can use asyncio.run directly
-                    updated_links = asyncio.run(extract_links())
+                # Run the async operation on the shared background loop
+                updated_links = run_coroutine_sync(extract_links())
                 
                 # Convert back to dict format
                 links["internal"] = [link.dict() for link in updated_links.internal]
@@ -1020,11 +1027,16 @@ class WebScrapingStrategy(ContentScrapingStrategy):
 
         # # Process images using ThreadPoolExecutor
         imgs = body.find_all("img")
+        # The tree is no longer mutated past this point, so ancestor text
+        # can be shared across all images.
+        parent_text_cache = {}
 
         media["images"] = [
             img
             for result in (
-                self.process_image(img, url, i, len(imgs), **kwargs)
+                self.process_image(
+                    img, url, i, len(imgs), parent_text_cache=parent_text_cache, **kwargs
+                )
                 for i, img in enumerate(imgs)
             )
             if result is not None
@@ -1050,11 +1062,11 @@ class WebScrapingStrategy(ContentScrapingStrategy):
 
         str_body = ""
         try:
-            str_body = content_element.encode_contents().decode("utf-8")
+            str_body = content_element.decode_contents()
         except Exception:
             # Reset body to the original HTML
             success = False
-            body = BeautifulSoup(html, "html.parser")
+            body = BeautifulSoup(html, parser_type)
 
             # Create a new div with a special ID
             error_div = body.new_tag("div", id="crawl4ai_error_message")
@@ -1075,7 +1087,7 @@ class WebScrapingStrategy(ContentScrapingStrategy):
 
             # Append the error div to the body
             body.append(error_div)
-            str_body = body.encode_contents().decode("utf-8")
+            str_body = body.decode_contents()
 
             print(
                 "[LOG] 😧 Error: After processing the crawled HTML and removing irrelevant tags, nothing was left in the page. Check the markdown for further details."
@@ -1116,8 +1128,22 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
         base_domain = kwargs.get("base_domain", get_base_domain(url))
         exclude_domains = set(kwargs.get("exclude_domains", []))
 
+        # Collect links, images and media in one walk instead of one XPath
+        # query per tag; they are still processed in the same order below.
+        links, images = [], []
+        media_elements = {"video": [], "audio": []}
+        for el in element.iterdescendants("a", "img", "video", "audio"):
+            if el.tag == "a":
+                if el.get("href") is not None:
+                    links.append(el)
+            elif el.tag == "img":
+                images.append(el)
+            else:
+                media_elements[el.tag].append(el)
+        links_removed = False
+
         # Process links
-        for link in element.xpath(".//a[@href]"):
+        for link in links:
             href = link.get("href", "").strip()
             if not href:
                 continue
@@ -1159,6 +1185,7 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
                         or link_base_domain in exclude_domains
                     ):
                         link.getparent().remove(link)
+                        links_removed = True
                         continue
 
                     if normalized_href not in external_links_dict:
@@ -1171,8 +1198,18 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
                 self._log("error", f"Error processing link: {str(e)}", "SCRAPE")
                 continue
 
+        # Images and media inside a link removed above are gone from the
+        # tree: walk again so they are not reported
+        if links_removed:
+            images = []
+            media_elements = {"video": [], "audio": []}
+            for el in element.iterdescendants("img", "video", "audio"):
+                if el.tag == "img":
+                    images.append(el)
+                else:
+                    media_elements[el.tag].append(el)
+
         # Process images
-        images = element.xpath(".//img")
         total_images = len(images)
 
         for idx, img in enumerate(images):
@@ -1203,7 +1240,7 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
 
         # Process videos and audios
         for media_type in ["video", "audio"]:
-            for elem in element.xpath(f".//{media_type}"):
+            for elem in media_elements[media_type]:
                 media_info = {
                     "src": elem.get("src"),
                     "alt": elem.get("alt"),
@@ -1403,10 +1440,12 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
             if el.tag in bypass_tags:
                 continue
 
-            text_content = (el.text_content() or "").strip()
-            if (
-                len(text_content.split()) < word_count_threshold
-                and not el.getchildren()
+            # Leaf check first: it is O(1), while text_content() of a container
+            # copies all of its descendants' text. split(None, n) stops counting
+            # once the threshold is reached.
+            if len(el) == 0 and (
+                len((el.text_content() or "").split(None, word_count_threshold))
+                < word_count_threshold
             ):
                 parent = el.getparent()
                 if parent is not None:
@@ -1592,15 +1631,15 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
                     title_elements = doc.xpath('//title')
                     page_title = title_elements[0].text_content() if title_elements else ""
                     
-                    # Extract headlines
-                    headlines = []
-                    for tag in ['h1', 'h2', 'h3']:
-                        elements = doc.xpath(f'//{tag}')
-                        for el in elements:
-                            text = el.text_content().strip()
-                            if text:
-                                headlines.append(text)
-                    headlines_text = ' '.join(headlines)
+                    # Extract headlines in a single walk, grouped by level
+                    headlines = {'h1': [], 'h2': [], 'h3': []}
+                    for el in doc.iter('h1', 'h2', 'h3'):
+                        text = el.text_content().strip()
+                        if text:
+                            headlines[el.tag].append(text)
+                    headlines_text = ' '.join(
+                        headlines['h1'] + headlines['h2'] + headlines['h3']
+                    )
                     
                     # Extract meta description
                     meta_desc_elements = doc.xpath('//meta[@name="description"]/@content')
@@ -1668,10 +1707,11 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
                 content_element = body
 
             # Remove script and style tags
-            for tag in ["script", "style", "link", "meta", "noscript"]:
-                for element in body.xpath(f".//{tag}"):
-                    if element.getparent() is not None:
-                        element.getparent().remove(element)
+            for element in list(
+                body.iterdescendants("script", "style", "link", "meta", "noscript")
+            ):
+                if element.getparent() is not None:
+                    element.getparent().remove(element)
 
             # Handle social media and domain exclusions
             kwargs["exclude_domains"] = set(kwargs.get("exclude_domains", []))
@@ -1783,18 +1823,8 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
                         async with LinkPreview(self.logger) as extractor:
                             return await extractor.extract_link_heads(links_obj, config)
                     
-                    # Run the async operation
-                    try:
-                        # Check if we're already in an async context
-                        loop = asyncio.get_running_loop()
-                        # If we're in an async context, we need to run in a thread
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(asyncio.run, extract_links())
-                            updated_links = future.result()
-                    except RuntimeError:
-                        # No running loop, we can use asyncio.run directly
-                        updated_links = asyncio.run(extract_links())
+                    # Run the async operation on the shared background loop
+                    updated_links = run_coroutine_sync(extract_links())
                     
                     # Convert back to dict format
                     links["internal"] = [link.dict() for link in updated_links.internal]
@@ -29,39 +29,48 @@ class GoogleSearchCrawler(BaseCrawler):
         if kwargs.get("page_length", 1) > 1:
             url = f"{url}&num={kwargs['page_length']}"
             
-        browser_config = BrowserConfig(headless=True, verbose=True)
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            config = CrawlerRunConfig(
-                cache_mode=kwargs.get("cache_mode", CacheMode.BYPASS),
-                keep_attrs=["id", "class"],
-                keep_data_attributes=True,
-                delay_before_return_html=kwargs.get(
-                    "delay", 2 if search_type == "image" else 1),
-                js_code=self.js_script if search_type == "image" else None,
-            )
+        # A caller running several searches can pass its own started crawler
+        # and skip a Chromium launch per call
+        crawler = kwargs.pop("crawler", None)
+        if crawler is None:
+            browser_config = BrowserConfig(headless=True, verbose=True)
+            async with AsyncWebCrawler(config=browser_config) as crawler:
+                return await self._search(crawler, url, search_type, schema_cache_path, **kwargs)
+        return await self._search(crawler, url, search_type, schema_cache_path, **kwargs)
+
+    async def _search(self, crawler: AsyncWebCrawler, url: str, search_type: str, schema_cache_path = None, **kwargs) -> str:
+        """Fetch one results page with crawler and extract it"""
+        config = CrawlerRunConfig(
+            cache_mode=kwargs.get("cache_mode", CacheMode.BYPASS),
+            keep_attrs=["id", "class"],
+            keep_data_attributes=True,
+            delay_before_return_html=kwargs.get(
+                "delay", 2 if search_type == "image" else 1),
+            js_code=self.js_script if search_type == "image" else None,
+        )
+
+        result = await crawler.arun(url=url, config=config)
+        if not result.success:
+            return json.dumps({"error": result.error})
 
-            result = await crawler.arun(url=url, config=config)
-            if not result.success:
-                return json.dumps({"error": result.error})
-
-            if search_type == "image":
-                if result.js_execution_result.get("success", False) is False:
-                    return json.dumps({"error": result.js_execution_result.get("error", "Unknown error")})
-                if "results" in result.js_execution_result:
-                    image_result = result.js_execution_result['results'][0]
-                    if image_result.get("success", False) is False:
-                        return json.dumps({"error": image_result.get("error", "Unknown error")})
-                    return json.dumps(image_result["result"], indent=4)
-
-            # For text search, extract structured data
-            schemas = await self._build_schemas(result.cleaned_html, schema_cache_path)
-            extracted = {
-                key: JsonCssExtractionStrategy(schema=schemas[key]).run(
-                    url=url, sections=[result.html]
-                )
-                for key in schemas
-            }
-            return json.dumps(extracted, indent=4)
+        if search_type == "image":
+            if result.js_execution_result.get("success", False) is False:
+                return json.dumps({"error": result.js_execution_result.get("error", "Unknown error")})
+            if "results" in result.js_execution_result:
+                image_result = result.js_execution_result['results'][0]
+                if image_result.get("success", False) is False:
+                    return json.dumps({"error": image_result.get("error", "Unknown error")})
+                return json.dumps(image_result["result"], indent=4)
+
+        # For text search, extract structured data
+        schemas = await self._build_schemas(result.cleaned_html, schema_cache_path)
+        extracted = {
+            key: JsonCssExtractionStrategy(schema=schemas[key]).run(
+                url=url, sections=[result.html]
+            )
+            for key in schemas
+        }
+        return json.dumps(extracted, indent=4)
 
     async def _build_schemas(self, html: str, schema_cache_path: str = None) -> Dict[str, Dict]:
         """Build extraction schemas (organic, top stories, etc.)"""
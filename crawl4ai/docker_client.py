@@ -44,6 +44,7 @@ class Crawl4aiDockerClient:
             headers={"Content-Type": "application/json"}
         )
         self._token: Optional[str] = None
+        self._server_checked = False
 
     async def authenticate(self, email: str) -> None:
         """Authenticate with the server and store the token."""
@@ -62,9 +63,16 @@ class Crawl4aiDockerClient:
             raise ConnectionError(error_msg)
 
     async def _check_server(self) -> None:
-        """Check if server is reachable, raising an error if not."""
+        """Check if server is reachable, raising an error if not.
+
+        Only the first crawl on a client pays for the /health round trip; after
+        that, connection failures surface from the crawl request itself.
+        """
+        if self._server_checked:
+            return
         try:
             await self._http_client.get(urljoin(self.base_url, "/health"))
+            self._server_checked = True
             self.logger.success(f"Connected to {self.base_url}", tag="READY")
         except httpx.RequestError as e:
             self.logger.error(f"Server unreachable: {str(e)}", tag="ERROR")
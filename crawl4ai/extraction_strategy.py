@@ -40,7 +40,6 @@ from .model_loader import (
 from .types import LLMConfig, create_llm_config
 
 from functools import partial
-import numpy as np
 import re
 from bs4 import BeautifulSoup
 from lxml import html, etree
@@ -295,6 +294,7 @@ class CosineStrategy(ExtractionStrategy):
         """
         # if self.buffer_embeddings.any() and not bypass_buffer:
         #     return self.buffer_embeddings
+        import numpy as np
 
         if self.device.type in ["cpu", "gpu", "cuda", "mps"]:
             import torch
@@ -576,11 +576,11 @@ class LLMExtractionStrategy(ExtractionStrategy):
     def __setattr__(self, name, value):
         """Handle attribute setting."""
         # TODO: Planning to set properties dynamically based on the __init__ signature
-        sig = inspect.signature(self.__init__)
-        all_params = sig.parameters  # Dictionary of parameter names and their details
-
-        if name in self._UNWANTED_PROPS and value is not all_params[name].default:
-            raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
+        # Only deprecated names need the (slow) signature lookup; __init__ sets many attributes
+        if name in self._UNWANTED_PROPS:
+            all_params = inspect.signature(self.__init__).parameters
+            if value is not all_params[name].default:
+                raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
         
         super().__setattr__(name, value)  
         
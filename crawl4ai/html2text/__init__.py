@@ -786,7 +786,7 @@ class HTML2Text(html.parser.HTMLParser):
                 # This is a very dangerous call ... it could mess up
                 # all handling of &nbsp; when not handled properly
                 # (see entityref)
-                data = re.sub(r"\s+", r" ", data)
+                data = config.RE_WHITESPACE_RUN.sub(" ", data)
                 if data and data[0] == " ":
                     self.space = True
                     data = data[1:]
@@ -887,7 +887,7 @@ class HTML2Text(html.parser.HTMLParser):
             self.preceding_stressed = True
         elif self.preceding_stressed:
             if (
-                re.match(r"[^][(){}\s.!?]", data[0])
+                config.RE_AFTER_STRESSED.match(data[0])
                 and not hn(self.current_tag)
                 and self.current_tag not in ["a", "code", "pre"]
             ):
@@ -972,7 +972,8 @@ class HTML2Text(html.parser.HTMLParser):
         if not self.body_width:
             return text
 
-        result = ""
+        parts = []
+        append = parts.append
         newlines = 0
         # I cannot think of a better solution for now.
         # To avoid the non-wrap behaviour for entire paras
@@ -999,15 +1000,15 @@ class HTML2Text(html.parser.HTMLParser):
                         break_long_words=False,
                         subsequent_indent=indent,
                     )
-                    result += "\n".join(wrapped)
+                    append("\n".join(wrapped))
                     if para.endswith("  "):
-                        result += "  \n"
+                        append("  \n")
                         newlines = 1
                     elif indent:
-                        result += "\n"
+                        append("\n")
                         newlines = 1
                     else:
-                        result += "\n\n"
+                        append("\n\n")
                         newlines = 2
                 else:
                     # Warning for the tempted!!!
@@ -1015,13 +1016,14 @@ class HTML2Text(html.parser.HTMLParser):
                     # line.isspace()
                     # DOES NOT work! Explanations are welcome.
                     if not config.RE_SPACE.match(para):
-                        result += para + "\n"
+                        append(para)
+                        append("\n")
                         newlines = 1
             else:
                 if newlines < 2:
-                    result += "\n"
+                    append("\n")
                     newlines += 1
-        return result
+        return "".join(parts)
 
 
 def html2text(html: str, baseurl: str = "", bodywidth: Optional[int] = None) -> str:
@@ -62,6 +62,9 @@ USE_AUTOMATIC_LINKS = True
 
 # For checking space-only lines on line 771
 RE_SPACE = re.compile(r"\s\+")
+RE_WHITESPACE_RUN = re.compile(r"\s+")
+# first char of text following an emphasis mark that needs a separating space
+RE_AFTER_STRESSED = re.compile(r"[^][(){}\s.!?]")
 
 RE_ORDERED_LIST_MATCHER = re.compile(r"\d+\.\s")
 RE_UNORDERED_LIST_MATCHER = re.compile(r"[-\*\+]\s")
@@ -216,19 +216,21 @@ def escape_md_section(
     Escapes markdown-sensitive characters across whole document sections.
     Each escaping operation can be controlled individually.
     """
-    if escape_backslash:
+    # Called for every text node: the `in` checks skip regex passes that
+    # cannot match.
+    if escape_backslash and "\\" in text:
         text = config.RE_MD_BACKSLASH_MATCHER.sub(r"\\\1", text)
 
     if snob:
         text = config.RE_MD_CHARS_MATCHER_ALL.sub(r"\\\1", text)
 
-    if escape_dot:
+    if escape_dot and "." in text:
         text = config.RE_MD_DOT_MATCHER.sub(r"\1\\\2", text)
 
-    if escape_plus:
+    if escape_plus and "+" in text:
         text = config.RE_MD_PLUS_MATCHER.sub(r"\1\\\2", text)
 
-    if escape_dash:
+    if escape_dash and "-" in text:
         text = config.RE_MD_DASH_MATCHER.sub(r"\1\\\2", text)
 
     return text
@@ -5,6 +5,12 @@ from .async_logger import AsyncLogger, LogLevel
 from pathlib import Path
 import os
 import shutil
+import hashlib
+import importlib.metadata
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
 # Initialize logger
 logger = AsyncLogger(log_level=LogLevel.DEBUG, verbose=True)
@@ -48,18 +54,30 @@ def post_install():
     logger.info("Running post-installation setup...", tag="INIT")
     setup_home_directory()
 
-    # Check environment variable to conditionally skip Playwright install
-    run_mode = os.getenv('CRAWL4AI_MODE')
-    if run_mode == 'api':
-        logger.warning(
-            "CRAWL4AI_MODE=api detected. Skipping Playwright browser installation.",
-            tag="SETUP"
-        )
-    else:
-        # Proceed with installation only if mode is not 'api'
-        install_playwright()
+    # A previous setup of this version already initialised the database
+    sentinel = _install_sentinel()
+    migrated = sentinel.exists() and (sentinel.parent / "crawl4ai.db").exists()
+    if migrated:
+        logger.info("Database already initialized for this version. Skipping.", tag="INIT")
+
+    # The database migration does not depend on the browser, so run it
+    # alongside the (subprocess-bound) browser probe/install
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        migration = None if migrated else executor.submit(run_migration)
+
+        # Check environment variable to conditionally skip Playwright install
+        run_mode = os.getenv('CRAWL4AI_MODE')
+        if run_mode == 'api':
+            logger.warning(
+                "CRAWL4AI_MODE=api detected. Skipping Playwright browser installation.",
+                tag="SETUP"
+            )
+        else:
+            # Proceed with installation only if mode is not 'api'
+            install_playwright()
 
-    run_migration()
+        if migration is not None and migration.result():
+            sentinel.touch()
     # TODO: Will be added in the future
     # setup_builtin_browser()
     logger.success("Post-installation setup completed!", tag="COMPLETE")
@@ -91,38 +109,203 @@ async def _setup_builtin_browser():
         raise
 
 
+# Launch probe executed in a child interpreter (see check_playwright_browser).
+# channel='chromium' matches BrowserConfig's default: the full build in new headless mode.
+_BROWSER_PROBE = (
+    "from playwright.sync_api import sync_playwright\n"
+    "with sync_playwright() as p:\n"
+    "    p.chromium.launch(headless=True, channel='chromium').close()\n"
+)
+
+
+def playwright_browsers_path() -> Path:
+    """Return the directory Playwright installs browsers into."""
+    custom = os.getenv("PLAYWRIGHT_BROWSERS_PATH")
+    if custom and custom != "0":
+        return Path(custom)
+    if sys.platform == "win32":
+        return Path(os.getenv("LOCALAPPDATA", Path.home())) / "ms-playwright"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "ms-playwright"
+    return Path.home() / ".cache" / "ms-playwright"
+
+
+@lru_cache(maxsize=1)
+def _playwright_version() -> str:
+    """Installed Playwright version ("" if unknown); fixed for the life of the process."""
+    try:
+        return importlib.metadata.version("playwright")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+@lru_cache(maxsize=1)
+def _pinned_chromium_revision() -> Optional[str]:
+    """
+    Chromium revision the installed Playwright pins, read from the driver's
+    browsers.json so no driver process is started. None if the driver layout is
+    not the one we know.
+    """
+    try:
+        from playwright._impl._driver import compute_driver_executable
+
+        _, driver_cli = compute_driver_executable()
+        manifest = json.loads((Path(driver_cli).parent / "browsers.json").read_text())
+        return next(
+            b["revision"] for b in manifest["browsers"] if b["name"] == "chromium"
+        )
+    except Exception:
+        return None
+
+
+def _expected_chromium_dir() -> Optional[Path]:
+    """
+    Directory the installed Playwright expects its pinned Chromium build in.
+
+    Returns None if the pinned revision is unknown, and callers fall back to a
+    looser check.
+    """
+    revision = _pinned_chromium_revision()
+    if revision is None:
+        return None
+    return playwright_browsers_path() / f"chromium-{revision}"
+
+
+def _browser_probe_marker() -> Optional[Path]:
+    """
+    Marker file recording a successful probe for the current browsers directory.
+
+    The name is keyed on the directory path and mtime, so installing, removing or
+    upgrading browsers invalidates it. The installed Playwright version is part of
+    the key too: a new Playwright release pins a different Chromium build, and the
+    old build left on disk would otherwise keep the stale marker valid.
+    """
+    browsers_dir = playwright_browsers_path()
+    if not browsers_dir.is_dir():
+        return None
+    key = hashlib.sha1(
+        f"{browsers_dir}:{browsers_dir.stat().st_mtime_ns}:{_playwright_version()}".encode()
+    ).hexdigest()[:16]
+    from .utils import get_home_folder
+    return Path(get_home_folder()) / f"browser_ok.{key}"
+
+
+def check_playwright_browser(timeout: int = 60, use_cache: bool = True) -> bool:
+    """
+    Check whether Playwright can launch Chromium.
+
+    The probe runs in a separate interpreter so the sync Playwright driver never
+    shares process or event-loop state with the caller. A passing probe is cached
+    on disk (see _browser_probe_marker), so later checks against the same browsers
+    directory skip the launch entirely; if the Chromium build this Playwright pins is
+    not present the check fails without launching anything.
+
+    Args:
+        timeout (int): Seconds to wait for the probe before giving up.
+        use_cache (bool): Trust a previous successful probe if one is recorded.
+
+    Returns:
+        bool: True if Chromium launched and closed cleanly.
+    """
+    marker = _browser_probe_marker()
+    if use_cache and marker is not None and marker.exists():
+        return True
+    # The pinned Chromium build is not on disk (never installed, or only an older
+    # Playwright's build is left): nothing usable to launch, skip spawning the probe
+    if marker is None:
+        return False
+    chromium_dir = _expected_chromium_dir()
+    if chromium_dir is not None:
+        if not chromium_dir.is_dir():
+            return False
+    elif not any(playwright_browsers_path().glob("chromium-*")):
+        return False
+    try:
+        subprocess.run(
+            [sys.executable, "-c", _BROWSER_PROBE],
+            check=True,
+            # only the exit status is used: don't buffer the driver's error dump
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return False
+    marker = _browser_probe_marker()
+    if marker is not None:
+        marker.touch()
+    return True
+
+
+def _playwright_cli():
+    """
+    Command prefix and environment for running the Playwright CLI.
+
+    ``python -m playwright`` only starts a second interpreter to exec Playwright's
+    bundled Node driver, so call the driver directly and skip that interpreter
+    start-up. Falls back to the module entry point if the driver layout changes.
+    """
+    try:
+        from playwright._impl._driver import compute_driver_executable, get_driver_env
+
+        driver_executable, driver_cli = compute_driver_executable()
+        return [str(driver_executable), str(driver_cli)], get_driver_env()
+    except Exception:
+        return [sys.executable, "-m", "playwright"], None
+
+
 def install_playwright():
+    """
+    Download Playwright's Chromium unless a working one is already installed.
+
+    System libraries are installed too (``--with-deps``, which needs root and a
+    package manager). Set CRAWL4AI_PLAYWRIGHT_WITH_DEPS=0 to fetch only the browser
+    binaries, e.g. when the image already provides the libraries.
+    """
+    if check_playwright_browser():
+        logger.info("Playwright Chromium is already installed and launches. Skipping download.", tag="INIT")
+        return
+
+    with_deps = os.getenv("CRAWL4AI_PLAYWRIGHT_WITH_DEPS", "1") != "0"
+    deps_flag = ["--with-deps"] if with_deps else []
     logger.info("Installing Playwright browsers...", tag="INIT")
     try:
         # subprocess.check_call([sys.executable, "-m", "playwright", "install", "--with-deps", "--force", "chrome"])
+        cli, env = _playwright_cli()
         subprocess.check_call(
             [
-                sys.executable,
-                "-m",
-                "playwright",
+                *cli,
                 "install",
-                "--with-deps",
+                *deps_flag,
                 "--force",
+                "--no-shell",  # crawl4ai never launches chromium-headless-shell
                 "chromium",
-            ]
+            ],
+            env=env,
         )
         logger.success(
             "Playwright installation completed successfully.", tag="COMPLETE"
         )
-    except subprocess.CalledProcessError:
-        # logger.error(f"Error during Playwright installation: {e}", tag="ERROR")
-        logger.warning(
-            f"Please run '{sys.executable} -m playwright install --with-deps' manually after the installation."
-        )
     except Exception:
-        # logger.error(f"Unexpected error during Playwright installation: {e}", tag="ERROR")
+        # CalledProcessError or anything unexpected: same manual fallback
         logger.warning(
-            f"Please run '{sys.executable} -m playwright install --with-deps' manually after the installation."
+            f"Please run '{sys.executable} -m playwright install{' --with-deps' if with_deps else ''}' manually after the installation."
         )
 
 
-def run_migration():
-    """Initialize database during installation"""
+def _install_sentinel() -> Path:
+    """
+    File marking a completed crawl4ai-setup database initialisation.
+
+    The crawl4ai version is part of the name, so upgrading re-runs the migration.
+    """
+    from .__version__ import __version__
+    from .utils import get_home_folder
+    return Path(get_home_folder()) / f".installed_v{__version__}"
+
+
+def run_migration() -> bool:
+    """Initialize database during installation; returns True on success"""
     try:
         logger.info("Starting database initialization...", tag="INIT")
         from crawl4ai.async_database import async_db_manager
@@ -131,11 +314,13 @@ def run_migration():
         logger.success(
             "Database initialization completed successfully.", tag="COMPLETE"
         )
+        return True
     except ImportError:
         logger.warning("Database module not found. Will initialize on first use.")
     except Exception as e:
         logger.warning(f"Database initialization failed: {e}")
         logger.warning("Database will be initialized on first use")
+    return False
 
 
 async def run_doctor():
@@ -158,9 +343,10 @@ async def run_doctor():
             viewport_height=720,
         )
 
+        # Only the markdown is checked below; a screenshot would add a capture
+        # and base64 pass that the health check never looks at
         run_config = CrawlerRunConfig(
             cache_mode=CacheMode.BYPASS,
-            screenshot=True,
         )
 
         async with AsyncWebCrawler(config=browser_config) as crawler:
@@ -180,7 +366,5 @@ async def run_doctor():
 
 def doctor():
     """Entry point for the doctor command"""
-    import asyncio
-
     asyncio.run(run_doctor())
     sys.exit(0)
@@ -1,12 +1,31 @@
 from pathlib import Path
 import asyncio
 from dataclasses import asdict
+from functools import lru_cache
 from crawl4ai.async_logger import AsyncLogger
 from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
 from crawl4ai.models import AsyncCrawlResponse, ScrapingResult 
 from crawl4ai.content_scraping_strategy import ContentScrapingStrategy
 from .processor import NaivePDFProcessorStrategy  # Assuming your current PDF code is in pdf_processor.py
 
+
+@lru_cache(maxsize=1)
+def _http_session():
+    """Shared requests session so repeat PDF downloads from a host reuse pooled TCP/TLS connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 class PDFCrawlerStrategy(AsyncCrawlerStrategy):
     def __init__(self, logger: AsyncLogger = None):
         self.logger = logger
@@ -153,16 +172,16 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
                 
                 # Download PDF with streaming and timeout
                 # Connection timeout: 10s, Read timeout: 300s (5 minutes for large PDFs)
-                response = requests.get(url, stream=True, timeout=(20, 60 * 10))
+                response = _http_session().get(url, stream=True, timeout=(20, 60 * 10))
                 response.raise_for_status()
                 
                 # Get file size if available
                 total_size = int(response.headers.get('content-length', 0))
                 downloaded = 0
                 
-                # Write to temp file
-                with open(temp_file.name, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                # Write to temp file (reuse the handle we already hold; 1 MiB chunks)
+                with temp_file as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
                         f.write(chunk)
                         downloaded += len(chunk)
                         if self.logger and total_size > 0:
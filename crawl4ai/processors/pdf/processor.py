@@ -70,7 +70,6 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         self.save_images_locally = save_images_locally
         self.image_save_dir = image_save_dir
         self.batch_size = batch_size
-        self._temp_dir = None
 
     def process(self, pdf_path: Path) -> PDFProcessResult:
         # Import inside method to allow dependency to be optional
@@ -85,6 +84,7 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
             pages=[],
             version="1.1"
         )
+        temp_dir = None
 
         try:
             with pdf_path.open('rb') as file:
@@ -98,8 +98,8 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
                         image_dir = Path(self.image_save_dir)
                         image_dir.mkdir(exist_ok=True, parents=True)
                     else:
-                        self._temp_dir = tempfile.mkdtemp(prefix='pdf_images_')
-                        image_dir = Path(self._temp_dir)
+                        temp_dir = tempfile.mkdtemp(prefix='pdf_images_')
+                        image_dir = Path(temp_dir)
 
                 for page_num, page in enumerate(reader.pages):
                     self.current_page_number = page_num + 1
@@ -110,11 +110,13 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
             logger.error(f"Failed to process PDF: {str(e)}")
             raise
         finally:
-            # Cleanup temp directory if it was created
-            if self._temp_dir and not self.image_save_dir:
+            # Cleanup temp directory if this call created one. Kept local rather
+            # than on self so concurrent calls can't overwrite (and leak) each
+            # other's directory.
+            if temp_dir:
                 import shutil
                 try:
-                    shutil.rmtree(self._temp_dir)
+                    shutil.rmtree(temp_dir)
                 except Exception as e:
                     logger.error(f"Failed to cleanup temp directory: {str(e)}")
 
@@ -143,6 +145,7 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
             pages=[],
             version="1.1" 
         )
+        temp_dir = None
 
         try:
             # Get metadata and page count from main thread
@@ -158,8 +161,8 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
                     image_dir = Path(self.image_save_dir)
                     image_dir.mkdir(exist_ok=True, parents=True)
                 else:
-                    self._temp_dir = tempfile.mkdtemp(prefix='pdf_images_')
-                    image_dir = Path(self._temp_dir)
+                    temp_dir = tempfile.mkdtemp(prefix='pdf_images_')
+                    image_dir = Path(temp_dir)
 
             def process_page_safely(page_num: int):
                 # Each thread opens its own file handle
@@ -190,11 +193,11 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
             logger.error(f"Failed to process PDF: {str(e)}")
             raise
         finally:
-            # Cleanup temp directory if it was created
-            if self._temp_dir and not self.image_save_dir:
+            # Cleanup temp directory if this call created one
+            if temp_dir:
                 import shutil
                 try:
-                    shutil.rmtree(self._temp_dir)
+                    shutil.rmtree(temp_dir)
                 except Exception as e:
                     logger.error(f"Failed to cleanup temp directory: {str(e)}")
 
@@ -207,8 +210,10 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         )
 
         # Text and font extraction
+        text_parts = []
+
         def visitor_text(text, cm, tm, font_dict, font_size):
-            pdf_page.raw_text += text
+            text_parts.append(text)
             pdf_page.layout.append({
                 "type": "text",
                 "text": text,
@@ -217,6 +222,7 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
             })
         
         page.extract_text(visitor_text=visitor_text)
+        pdf_page.raw_text = "".join(text_parts)
 
         # Image extraction
         if self.extract_images:
@@ -1,5 +1,25 @@
 import re
 
+# Patterns shared by clean_pdf_text / clean_pdf_text_to_html, which run once per
+# page and test most of these on every line.
+RE_WHITESPACE = re.compile(r'\s+')
+RE_SENTENCE_BREAK = re.compile(r'\.\n')
+RE_NUMBERED_HEADER = re.compile(r'^(\d+(?:\.\d+)*)\s+(.+)$')
+RE_SECTION_HEADER = re.compile(r'^(Abstract|\d+\s+[A-Z]|References|Appendix|Figure|Table)')
+RE_EMAIL = re.compile(r'\{.*?\}')
+RE_AFFILIATION = re.compile(r'^†')
+RE_QUOTE = re.compile(r'^["“]')
+RE_AUTHOR = re.compile(
+    r'^\s*[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?'
+    r'(?:,\s*[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?)*'
+    r'(?:,\s*(?:and|&)\s+[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?)?\s*$'
+)
+RE_AUTHOR_MARKERS = re.compile(r'[†â€]')
+RE_AUTHOR_SEPARATOR = re.compile(r', | and ')
+RE_CITATION = re.compile(r'\(([A-Z][a-z]+ et al\. \d{4})\)')
+RE_SPACED_HYPHEN = re.compile(r'\s+-\s+')
+RE_SPACE_BEFORE_PUNCT = re.compile(r'\s+([.,!?)])')
+
 def apply_png_predictor(data, width, bits, color_channels):
     """Decode PNG predictor (PDF 1.5+ filter)"""
     bytes_per_pixel = (bits * color_channels) // 8
@@ -65,7 +85,6 @@ def paeth_predictor(a, b, c):
     else:
         return c
 
-import re
 import html
 
 def clean_pdf_text_to_html(page_number, text):
@@ -83,19 +102,11 @@ def clean_pdf_text_to_html(page_number, text):
     output = []
     current_paragraph = []
     in_header = False
-    email_pattern = re.compile(r'\{.*?\}')
-    affiliation_pattern = re.compile(r'^†')
-    quote_pattern = re.compile(r'^["“]')
-    author_pattern = re.compile(
-        r'^\s*[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?'
-        r'(?:,\s*[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?)*'
-        r'(?:,\s*(?:and|&)\s+[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?)?\s*$'
-    )
     
     def flush_paragraph():
         if current_paragraph:
             para = ' '.join(current_paragraph)
-            para = re.sub(r'\s+', ' ', para).strip()
+            para = RE_WHITESPACE.sub(' ', para).strip()
             if para:
                 # escaped_para = html.escape(para)
                 escaped_para = para
@@ -124,8 +135,7 @@ def clean_pdf_text_to_html(page_number, text):
             continue
             
         # Detect numbered headers like "2.1 Background"
-        numbered_header = re.match(r'^(\d+(?:\.\d+)*)\s+(.+)$', line)
-        if i > 0 and not lines[i-1].strip() and numbered_header:
+        if i > 0 and not lines[i-1].strip() and (numbered_header := RE_NUMBERED_HEADER.match(line)):
             flush_paragraph()
             level = numbered_header.group(1).count('.') + 1
             header_text = numbered_header.group(2)
@@ -136,9 +146,9 @@ def clean_pdf_text_to_html(page_number, text):
             continue
             
         # Detect authors
-        if page_number == 1 and author_pattern.match(line):
-            authors = re.sub(r'[†â€]', '', line)
-            authors = re.split(r', | and ', authors)
+        if page_number == 1 and RE_AUTHOR.match(line):
+            authors = RE_AUTHOR_MARKERS.sub('', line)
+            authors = RE_AUTHOR_SEPARATOR.split(authors)
             formatted_authors = []
             for author in authors:
                 if author.strip():
@@ -156,19 +166,19 @@ def clean_pdf_text_to_html(page_number, text):
             continue
             
         # Detect affiliation
-        if affiliation_pattern.match(line):
+        if RE_AFFILIATION.match(line):
             escaped_line = html.escape(line)
             output.append(f'<p><em>{escaped_line}</em></p>')
             continue
             
         # Detect emails
-        if email_pattern.match(line):
+        if RE_EMAIL.match(line):
             escaped_line = html.escape(line)
             output.append(f'<p><code>{escaped_line}</code></p>')
             continue
             
         # Detect section headers
-        if re.match(r'^(Abstract|\d+\s+[A-Z]|References|Appendix|Figure|Table)', line):
+        if RE_SECTION_HEADER.match(line):
             flush_paragraph()
             escaped_line = html.escape(line)
             output.append(f'<h2 class="section-header"><em>{escaped_line}</em></h2>')
@@ -176,7 +186,7 @@ def clean_pdf_text_to_html(page_number, text):
             continue
             
         # Handle quotes
-        if quote_pattern.match(line):
+        if RE_QUOTE.match(line):
             flush_paragraph()
             escaped_line = html.escape(line)
             output.append(f'<blockquote><p>{escaped_line}</p></blockquote>')
@@ -199,14 +209,14 @@ def clean_pdf_text_to_html(page_number, text):
     html_output = '\n'.join(output)
     
     # Fix common citation patterns
-    html_output = re.sub(r'\(([A-Z][a-z]+ et al\. \d{4})\)', r'<cite>\1</cite>', html_output)
+    html_output = RE_CITATION.sub(r'<cite>\1</cite>', html_output)
     
     # Fix escaped characters
     html_output = html_output.replace('\\ud835', '').replace('\\u2020', '†')
     
     # Remove leftover hyphens and fix spacing
-    html_output = re.sub(r'\s+-\s+', '', html_output)
-    html_output = re.sub(r'\s+([.,!?)])', r'\1', html_output)
+    html_output = RE_SPACED_HYPHEN.sub('', html_output)
+    html_output = RE_SPACE_BEFORE_PUNCT.sub(r'\1', html_output)
     
     return html_output
 
@@ -219,24 +229,16 @@ def clean_pdf_text(page_number, text):
         decoded = text  # Fallback if decoding fails
     
     article_title_detected = False
-    decoded = re.sub(r'\.\n', '.\n\n', decoded)
+    decoded = RE_SENTENCE_BREAK.sub('.\n\n', decoded)
     lines = decoded.split('\n')
     output = []
     current_paragraph = []
     in_header = False
-    email_pattern = re.compile(r'\{.*?\}')
-    affiliation_pattern = re.compile(r'^†')
-    quote_pattern = re.compile(r'^["“]')
-    author_pattern = re.compile(
-        r'^\s*[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?'
-        r'(?:,\s*[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?)*'
-        r'(?:,\s*(?:and|&)\s+[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\s*(?:[†*0-9]+)?)?\s*$'
-    )
     
     def flush_paragraph():
         if current_paragraph:
             para = ' '.join(current_paragraph)
-            para = re.sub(r'\s+', ' ', para).strip()
+            para = RE_WHITESPACE.sub(' ', para).strip()
             if para:
                 output.append(para)
             current_paragraph.clear()
@@ -262,8 +264,7 @@ def clean_pdf_text(page_number, text):
             continue
                     
         # Detect numbered headers like "2.1 Background"
-        numbered_header = re.match(r'^(\d+(?:\.\d+)*)\s+(.+)$', line)
-        if not lines[i-1].strip() and numbered_header:
+        if not lines[i-1].strip() and (numbered_header := RE_NUMBERED_HEADER.match(line)):
             flush_paragraph()
             level = numbered_header.group(1).count('.') + 1  # Convert 2.1 → level 2
             header_text = numbered_header.group(2)
@@ -275,10 +276,10 @@ def clean_pdf_text(page_number, text):
             
                     
         # Detect authors
-        if page_number == 1 and author_pattern.match(line):
+        if page_number == 1 and RE_AUTHOR.match(line):
             # Clean and format author names
-            authors = re.sub(r'[†â€]', '', line)  # Remove affiliation markers
-            authors = re.split(r', | and ', authors)
+            authors = RE_AUTHOR_MARKERS.sub('', line)  # Remove affiliation markers
+            authors = RE_AUTHOR_SEPARATOR.split(authors)
             formatted_authors = []
             for author in authors:
                 if author.strip():
@@ -297,17 +298,17 @@ def clean_pdf_text(page_number, text):
             continue
             
         # Detect affiliation
-        if affiliation_pattern.match(line):
+        if RE_AFFILIATION.match(line):
             output.append(f'*{line}*')
             continue
             
         # Detect emails
-        if email_pattern.match(line):
+        if RE_EMAIL.match(line):
             output.append(f'`{line}`')
             continue
             
         # Detect section headers
-        if re.match(r'^(Abstract|\d+\s+[A-Z]|References|Appendix|Figure|Table)', line):
+        if RE_SECTION_HEADER.match(line):
             flush_paragraph()
             output.append(f'_[{line}]_')
             in_header = True
@@ -315,7 +316,7 @@ def clean_pdf_text(page_number, text):
             
            
         # Handle quotes
-        if quote_pattern.match(line):
+        if RE_QUOTE.match(line):
             flush_paragraph()
             output.append(f'> {line}')
             continue
@@ -337,14 +338,14 @@ def clean_pdf_text(page_number, text):
     markdown = '\n\n'.join(output)
     
     # Fix common citation patterns
-    markdown = re.sub(r'\(([A-Z][a-z]+ et al\. \d{4})\)', r'[\1]', markdown)
+    markdown = RE_CITATION.sub(r'[\1]', markdown)
     
     # Fix escaped characters
     markdown = markdown.replace('\\ud835', '').replace('\\u2020', '†')
     
     # Remove leftover hyphens and fix spacing
-    markdown = re.sub(r'\s+-\s+', '', markdown)  # Join hyphenated words
-    markdown = re.sub(r'\s+([.,!?)])', r'\1', markdown)  # Fix punctuation spacing
+    markdown = RE_SPACED_HYPHEN.sub('', markdown)  # Join hyphenated words
+    markdown = RE_SPACE_BEFORE_PUNCT.sub(r'\1', markdown)  # Fix punctuation spacing
     
     
     return markdown
@@ -12,7 +12,6 @@ from typing import Union, List, Optional
 # but we now also need the new script-builder prompt.
 from ..prompts import GENERATE_JS_SCRIPT_PROMPT, GENERATE_SCRIPT_PROMPT
 import logging
-import re
 
 from .c4a_result import (
     CompilationResult, ValidationResult, ErrorDetail, WarningDetail,
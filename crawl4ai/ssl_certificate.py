@@ -6,7 +6,6 @@ import base64
 import json
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse
-import OpenSSL.crypto
 from pathlib import Path
 
 # === Inherit from dict ===
@@ -83,6 +82,8 @@ class SSLCertificate(dict):
                          print(f"Warning: No certificate returned for {hostname}")
                          return None
 
+                    import OpenSSL.crypto  # deferred: pyOpenSSL import costs ~30ms
+
                     x509 = OpenSSL.crypto.load_certificate(
                         OpenSSL.crypto.FILETYPE_ASN1, cert_binary
                     )
@@ -169,6 +170,8 @@ class SSLCertificate(dict):
         try:
             # Decode the raw_cert (which should be string due to _decode)
             raw_cert_bytes = base64.b64decode(self.get("raw_cert", ""))
+            import OpenSSL.crypto
+
             x509 = OpenSSL.crypto.load_certificate(
                 OpenSSL.crypto.FILETYPE_ASN1, raw_cert_bytes
             )
@@ -1,4 +1,5 @@
 import random
+from functools import lru_cache
 from typing import Optional, Literal, List, Dict, Tuple
 import re
 
@@ -65,9 +66,26 @@ class UAGen(ABC):
 
         return ", ".join(hints)
 
+def _as_key(value):
+   return tuple(value) if isinstance(value, list) else value
+
+def _as_arg(value):
+   return list(value) if isinstance(value, tuple) else value
+
+@lru_cache(maxsize=32)
+def _user_agent_for(browsers, os, min_version, platforms, fallback) -> UserAgent:
+   """UserAgent() re-parses fake_useragent's whole browser DB; build one per filter set."""
+   return UserAgent(
+       browsers=_as_arg(browsers),
+       os=_as_arg(os),
+       min_version=min_version,
+       platforms=_as_arg(platforms),
+       fallback=fallback
+   )
+
 class ValidUAGenerator(UAGen):
    def __init__(self):
-       self.ua = UserAgent()
+       self.ua = None  # built lazily in generate()
        
    def generate(self,
                browsers: Optional[List[str]] = None,
@@ -77,12 +95,12 @@ class ValidUAGenerator(UAGen):
                pct_threshold: Optional[float] = None,
                fallback: str = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/116.0.0.0 Safari/537.36") -> str:
        
-       self.ua = UserAgent(
-           browsers=browsers or ['Chrome', 'Firefox', 'Edge'],
-           os=os or ['Windows', 'Mac OS X'],
-           min_version=min_version,
-           platforms=platforms or ['desktop'],
-           fallback=fallback
+       self.ua = _user_agent_for(
+           _as_key(browsers or ['Chrome', 'Firefox', 'Edge']),
+           _as_key(os or ['Windows', 'Mac OS X']),
+           min_version,
+           _as_key(platforms or ['desktop']),
+           fallback
        )
        return self.ua.random
 
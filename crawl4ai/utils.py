@@ -16,8 +16,7 @@ from .config import MIN_WORD_THRESHOLD, IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD, IM
 import httpx
 from socket import gaierror
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
-from urllib.parse import urljoin
+from typing import Dict, Any, List, Optional, Callable, Union
 import requests
 from requests.exceptions import InvalidSchema
 import xxhash
@@ -26,6 +25,7 @@ import cProfile
 import pstats
 from functools import wraps
 import asyncio
+import threading
 from lxml import etree, html as lhtml
 import sqlite3
 import hashlib
@@ -40,19 +40,20 @@ from typing import Sequence
 
 from itertools import chain
 from collections import deque
-from typing import  Generator, Iterable
+from typing import  Generator, Iterable, TYPE_CHECKING
 
-import numpy as np
+if TYPE_CHECKING:
+    # numpy is only needed by the embedding helpers, which import it lazily
+    import numpy as np
 
 from urllib.parse import (
-    urljoin, urlparse, urlunparse,
+    urljoin, urlparse, urlsplit, urlunparse,
     parse_qsl, urlencode, quote, unquote
 )
 
 
 # Monkey patch to fix wildcard handling in urllib.robotparser
 from urllib.robotparser import RuleLine
-import re
 
 original_applies_to = RuleLine.applies_to
 
@@ -258,8 +259,24 @@ class RobotsParser:
         self.cache_ttl = cache_ttl or self.CACHE_TTL
         os.makedirs(self.cache_dir, exist_ok=True)
         self.db_path = os.path.join(self.cache_dir, "robots_cache.db")
+        self._session: Optional[aiohttp.ClientSession] = None
         self._init_db()
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        # One pooled session for every robots.txt fetch, so concurrent
+        # arun_many() checks share connections and the DNS cache
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session used for robots.txt fetches"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def _init_db(self):
         # Use WAL mode for better concurrency and performance
         with sqlite3.connect(self.db_path) as conn:
@@ -340,13 +357,13 @@ class RobotsParser:
                 scheme = parsed.scheme or 'http'
                 robots_url = f"{scheme}://{domain}/robots.txt"
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(robots_url, timeout=2, ssl=False) as response:
-                        if response.status == 200:
-                            rules = await response.text()
-                            self._cache_rules(domain, rules)
-                        else:
-                            return True
+                session = self._get_session()
+                async with session.get(robots_url, timeout=2, ssl=False) as response:
+                    if response.status == 200:
+                        rules = await response.text()
+                        self._cache_rules(domain, rules)
+                    else:
+                        return True
             except Exception as _ex:
                 # On any error (timeout, connection failed, etc), allow access
                 return True
@@ -631,12 +648,17 @@ def get_home_folder():
     os.makedirs(f"{home_folder}/models", exist_ok=True)
     return home_folder
 
-async def get_chromium_path(browser_type) -> str:
+async def get_chromium_path(browser_type, playwright=None) -> str:
     """Returns the browser executable path using playwright's browser management.
     
     Uses playwright's built-in browser management to get the correct browser executable
     path regardless of platform. This ensures we're using the same browser version
     that playwright is tested with.
+
+    Args:
+        browser_type (str): One of "chromium", "firefox" or "webkit".
+        playwright: An already started Playwright instance to query. When omitted a
+            short-lived one is started, which spawns a separate driver process.
     
     Returns:
         str: Path to browser executable
@@ -660,29 +682,37 @@ async def get_chromium_path(browser_type) -> str:
         with open(path_file, "r") as f:
             return f.read()
 
+    if playwright is not None:
+        return _save_browser_path(playwright, browser_type)
+
     from playwright.async_api import async_playwright
     async with async_playwright() as p:
-        browsers = {
-            'chromium': p.chromium,
-            'firefox': p.firefox, 
-            'webkit': p.webkit
-        }
-        
-        if browser_type.lower() not in browsers:
-            raise ValueError(
-                f"Invalid browser type. Must be one of: {', '.join(browsers.keys())}"
-            )
-            
-        # Save the path int the crawl4ai home folder
-        home_folder = get_home_folder()
-        browser_path = browsers[browser_type.lower()].executable_path
-        if not browser_path:
-            raise RuntimeError(f"Browser executable not found for type: {browser_type}")
-        # Save the path in a text file with browser type name
-        with open(os.path.join(home_folder, f"{browser_type.lower()}.path"), "w") as f:
-            f.write(browser_path)
+        return _save_browser_path(p, browser_type)
+
+
+def _save_browser_path(p, browser_type: str) -> str:
+    """Look up the executable path for browser_type on a running Playwright and cache it."""
+    browsers = {
+        'chromium': p.chromium,
+        'firefox': p.firefox, 
+        'webkit': p.webkit
+    }
+    
+    if browser_type.lower() not in browsers:
+        raise ValueError(
+            f"Invalid browser type. Must be one of: {', '.join(browsers.keys())}"
+        )
         
-        return browser_path
+    # Save the path int the crawl4ai home folder
+    home_folder = get_home_folder()
+    browser_path = browsers[browser_type.lower()].executable_path
+    if not browser_path:
+        raise RuntimeError(f"Browser executable not found for type: {browser_type}")
+    # Save the path in a text file with browser type name
+    with open(os.path.join(home_folder, f"{browser_type.lower()}.path"), "w") as f:
+        f.write(browser_path)
+    
+    return browser_path
 
 def beautify_html(escaped_html):
     """
@@ -913,7 +943,7 @@ def get_content_of_website(
         if not html:
             return None
         # Parse HTML content with BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         # Get the content within the <body> tag
         body = soup.body
@@ -1167,7 +1197,7 @@ def get_content_of_website_optimized(
     if not html:
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     body = soup.body
 
     image_description_min_word_threshold = kwargs.get(
@@ -2021,14 +2051,21 @@ def wrap_text(draw, text, font, max_width):
     """
 
     # Wrap the text to fit within the specified width
+    # Walk the words by index: list.pop(0) shifted the whole list on every word
     lines = []
     words = text.split()
-    while words:
+    i, n = 0, len(words)
+    while i < n:
         line = ""
         while (
-            words and draw.textbbox((0, 0), line + words[0], font=font)[2] <= max_width
+            i < n and draw.textbbox((0, 0), line + words[i], font=font)[2] <= max_width
         ):
-            line += words.pop(0) + " "
+            line += words[i] + " "
+            i += 1
+        if not line:
+            # A single word wider than max_width gets a line of its own
+            line = words[i] + " "
+            i += 1
         lines.append(line)
     return "\n".join(lines)
 
@@ -2049,7 +2086,7 @@ def format_html(html_string):
         str: The prettified HTML string.
     """
 
-    soup = BeautifulSoup(html_string, "lxml.parser")
+    soup = BeautifulSoup(html_string, "lxml")
     return soup.prettify()
 
 
@@ -2119,6 +2156,12 @@ def normalize_url(href, base_url):
 
 
 
+_TRACKING_QUERY_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term',
+    'utm_content', 'gclid', 'fbclid', 'ref', 'ref_src'
+})
+
+
 def normalize_url(
     href: str,
     base_url: str,
@@ -2176,12 +2219,9 @@ def normalize_url(
         params = [(k.lower(), v) for k, v in parse_qsl(query, keep_blank_values=True)]
 
         if drop_query_tracking:
-            default_tracking = {
-                'utm_source', 'utm_medium', 'utm_campaign', 'utm_term',
-                'utm_content', 'gclid', 'fbclid', 'ref', 'ref_src'
-            }
+            default_tracking = _TRACKING_QUERY_PARAMS
             if extra_drop_params:
-                default_tracking |= {p.lower() for p in extra_drop_params}
+                default_tracking = default_tracking | {p.lower() for p in extra_drop_params}
             params = [(k, v) for k, v in params if k not in default_tracking]
 
         if sort_query:
@@ -2317,6 +2357,32 @@ def normalize_url_tmp(href, base_url):
     return href.strip()
 
 
+_HTTP_NETLOC_RE = re.compile(r"https?://([^/?#]*)")
+
+
+def _url_netloc(url: str) -> str:
+    """
+    Return the netloc of a URL, as urlsplit(url).netloc would.
+
+    Link classification runs this for every anchor on a page, and nearly all
+    of them are plain absolute http(s) URLs, so those are sliced out with one
+    regex match instead of building a SplitResult. Anything unusual
+    (other schemes, embedded tabs/newlines, brackets, non-ASCII hosts)
+    goes through urlsplit unchanged, so it raises ValueError exactly where
+    urlsplit would.
+    """
+    match = _HTTP_NETLOC_RE.match(url)
+    if (
+        match
+        and "[" not in match.group(1)
+        and "]" not in match.group(1)
+        and match.group(1).isascii()
+        and "\t" not in url and "\r" not in url and "\n" not in url
+    ):
+        return match.group(1)
+    return urlsplit(url).netloc
+
+
 def get_base_domain(url: str) -> str:
     """
     Extract the base domain from a given URL, handling common edge cases.
@@ -2334,7 +2400,7 @@ def get_base_domain(url: str) -> str:
     """
     try:
         # Get domain from URL
-        domain = urlparse(url).netloc.lower()
+        domain = _url_netloc(url).lower()
         if not domain:
             return ""
 
@@ -2342,7 +2408,8 @@ def get_base_domain(url: str) -> str:
         domain = domain.split(":")[0]
 
         # Remove www
-        domain = re.sub(r"^www\.", "", domain)
+        if domain.startswith("www."):
+            domain = domain[4:]
 
         # Extract last two parts of domain (handles co.uk etc)
         parts = domain.split(".")
@@ -2383,17 +2450,17 @@ def is_external_url(url: str, base_domain: str) -> bool:
     Returns:
         str: The extracted base domain or an empty string if parsing fails.
     """
-    special = {"mailto:", "tel:", "ftp:", "file:", "data:", "javascript:"}
-    if any(url.lower().startswith(p) for p in special):
+    special = ("mailto:", "tel:", "ftp:", "file:", "data:", "javascript:")
+    if url.lower().startswith(special):
         return True
 
     try:
-        parsed = urlparse(url)
-        if not parsed.netloc:  # Relative URL
+        netloc = _url_netloc(url)
+        if not netloc:  # Relative URL
             return False
 
         # Strip 'www.' from both domains for comparison
-        url_domain = parsed.netloc.lower().replace("www.", "")
+        url_domain = netloc.lower().replace("www.", "")
         base = base_domain.lower().replace("www.", "")
 
         # Check if URL domain ends with base domain
@@ -2678,9 +2745,11 @@ def profile_and_time(func):
     return wrapper
 
 
-def generate_content_hash(content: str) -> str:
-    """Generate a unique hash for content"""
-    return xxhash.xxh64(content.encode()).hexdigest()
+def generate_content_hash(content: Union[str, bytes]) -> str:
+    """Generate a unique hash for content (str is hashed as its UTF-8 encoding)"""
+    if isinstance(content, str):
+        content = content.encode()
+    return xxhash.xxh64(content).hexdigest()
     # return hashlib.sha256(content.encode()).hexdigest()
 
 
@@ -2820,12 +2889,13 @@ class HeadPeekr:
                     url = str(response.url)
                     response = await client.get(url, headers=headers)
                 
-                content = b""
+                content = bytearray()
                 async for chunk in response.aiter_bytes():
+                    start = max(len(content) - 6, 0)  # tag may straddle chunks
                     content += chunk
-                    if b"</head>" in content:
+                    if content.find(b"</head>", start) != -1:
                         break  # Stop after detecting </head>
-                return content.split(b"</head>")[0] + b"</head>"
+                return bytes(content).split(b"</head>")[0] + b"</head>"
         except (httpx.HTTPError, gaierror) :
             return None
 
@@ -3289,7 +3359,7 @@ async def get_text_embeddings(
     llm_config: Optional[Dict] = None,
     model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
     batch_size: int = 32
-) -> np.ndarray:
+) -> "np.ndarray":
     """
     Compute embeddings for a list of texts using specified model.
     
@@ -3370,18 +3440,58 @@ async def get_text_embeddings(
         return embeddings
 
 
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def run_coroutine_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Coroutines are submitted to a single long-lived event loop running in a daemon
+    thread, so callers neither pay for a fresh loop per call (as with ``asyncio.run``)
+    nor clash with a loop already running in the calling thread.
+
+    Args:
+        coro: The coroutine object to execute.
+
+    Returns:
+        The coroutine's result. Exceptions raised by the coroutine are re-raised.
+    """
+    global _background_loop
+    if _background_loop is not None and _background_loop.is_running():
+        try:
+            on_bridge = asyncio.get_running_loop() is _background_loop
+        except RuntimeError:
+            on_bridge = False
+        if on_bridge:
+            # Re-entered from a coroutine already on the bridge loop: waiting on it
+            # here would deadlock, so run this one on a private loop in a helper thread.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, coro).result()
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="crawl4ai-sync-bridge",
+                daemon=True,
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop).result()
+
+
 def get_text_embeddings_sync(
     texts: List[str],
     llm_config: Optional[Dict] = None,
     model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
     batch_size: int = 32
-) -> np.ndarray:
+) -> "np.ndarray":
     """Synchronous wrapper for get_text_embeddings"""
     import numpy as np
-    return asyncio.run(get_text_embeddings(texts, llm_config, model_name, batch_size))
+    return run_coroutine_sync(get_text_embeddings(texts, llm_config, model_name, batch_size))
 
 
-def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
+def cosine_similarity(vec1: "np.ndarray", vec2: "np.ndarray") -> float:
     """Calculate cosine similarity between two vectors"""
     import numpy as np
     dot_product = np.dot(vec1, vec2)
@@ -3389,7 +3499,7 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     return float(dot_product / norm_product) if norm_product != 0 else 0.0
 
 
-def cosine_distance(vec1: np.ndarray, vec2: np.ndarray) -> float:
+def cosine_distance(vec1: "np.ndarray", vec2: "np.ndarray") -> float:
     """Calculate cosine distance (1 - similarity) between two vectors"""
     return 1 - cosine_similarity(vec1, vec2)
 
@@ -1,6 +1,7 @@
 import os
 import json
 import asyncio
+import orjson
 from typing import List, Tuple, Dict
 from functools import partial
 from uuid import uuid4
@@ -40,7 +41,10 @@ from utils import (
     get_base_url,
     is_task_id,
     should_cleanup_task,
-    decode_redis_hash
+    decode_redis_hash,
+    ensure_scheme,
+    dumps_json,
+    FastJSONResponse
 )
 
 import psutil, time
@@ -48,13 +52,22 @@ import psutil, time
 logger = logging.getLogger(__name__)
 
 # --- Helper to get memory ---
+_PROCESS = psutil.Process()
+
 def _get_memory_mb():
     try:
-        return psutil.Process().memory_info().rss / (1024 * 1024)
+        return _PROCESS.memory_info().rss / (1024 * 1024)
     except Exception as e:
         logger.warning(f"Could not get memory info: {e}")
         return None
 
+def _result_to_dict(result) -> dict:
+    """CrawlResult -> JSON-ready dict (PDF bytes are base64-encoded)."""
+    result_dict = result.model_dump()
+    if result_dict.get('pdf') is not None:
+        result_dict['pdf'] = b64encode(result_dict['pdf']).decode('utf-8')
+    return result_dict
+
 
 async def handle_llm_qa(
     url: str,
@@ -63,22 +76,22 @@ async def handle_llm_qa(
 ) -> str:
     """Process QA using LLM with crawled content as context."""
     try:
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
+        url = ensure_scheme(url)
         # Extract base URL by finding last '?q=' occurrence
         last_q_index = url.rfind('?q=')
         if last_q_index != -1:
             url = url[:last_q_index]
 
         # Get markdown content
-        async with AsyncWebCrawler() as crawler:
-            result = await crawler.arun(url)
-            if not result.success:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error_message
-                )
-            content = result.markdown.fit_markdown or result.markdown.raw_markdown
+        from crawler_pool import get_crawler
+        crawler = await get_crawler(BrowserConfig())
+        result = await crawler.arun(url)
+        if not result.success:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error_message
+            )
+        content = result.markdown.fit_markdown or result.markdown.raw_markdown
 
         # Create prompt and get LLM response
         prompt = f"""Use the following content as context to answer the question.
@@ -131,15 +144,16 @@ async def process_llm_extraction(
 
         cache_mode = CacheMode.ENABLED if cache == "1" else CacheMode.WRITE_ONLY
 
-        async with AsyncWebCrawler() as crawler:
-            result = await crawler.arun(
-                url=url,
-                config=CrawlerRunConfig(
-                    extraction_strategy=llm_strategy,
-                    scraping_strategy=LXMLWebScrapingStrategy(),
-                    cache_mode=cache_mode
-                )
+        from crawler_pool import get_crawler
+        crawler = await get_crawler(BrowserConfig())
+        result = await crawler.arun(
+            url=url,
+            config=CrawlerRunConfig(
+                extraction_strategy=llm_strategy,
+                scraping_strategy=LXMLWebScrapingStrategy(),
+                cache_mode=cache_mode
             )
+        )
 
         if not result.success:
             await redis.hset(f"task:{task_id}", mapping={
@@ -154,7 +168,7 @@ async def process_llm_extraction(
             content = result.extracted_content
         await redis.hset(f"task:{task_id}", mapping={
             "status": TaskStatus.COMPLETED,
-            "result": json.dumps(content)
+            "result": dumps_json(content)
         })
 
     except Exception as e:
@@ -173,47 +187,47 @@ async def handle_markdown_request(
 ) -> str:
     """Handle markdown generation requests."""
     try:
-        decoded_url = unquote(url)
-        if not decoded_url.startswith(('http://', 'https://')):
-            decoded_url = 'https://' + decoded_url
+        decoded_url = ensure_scheme(unquote(url))
 
         if filter_type == FilterType.RAW:
             md_generator = DefaultMarkdownGenerator()
         else:
+            # Only build the filter that was asked for (the LLM one is not free)
             content_filter = {
-                FilterType.FIT: PruningContentFilter(),
-                FilterType.BM25: BM25ContentFilter(user_query=query or ""),
-                FilterType.LLM: LLMContentFilter(
+                FilterType.FIT: lambda: PruningContentFilter(),
+                FilterType.BM25: lambda: BM25ContentFilter(user_query=query or ""),
+                FilterType.LLM: lambda: LLMContentFilter(
                     llm_config=LLMConfig(
                         provider=config["llm"]["provider"],
                         api_token=os.environ.get(config["llm"].get("api_key_env", None), ""),
                     ),
                     instruction=query or "Extract main content"
                 )
-            }[filter_type]
+            }[filter_type]()
             md_generator = DefaultMarkdownGenerator(content_filter=content_filter)
 
         cache_mode = CacheMode.ENABLED if cache == "1" else CacheMode.WRITE_ONLY
 
-        async with AsyncWebCrawler() as crawler:
-            result = await crawler.arun(
-                url=decoded_url,
-                config=CrawlerRunConfig(
-                    markdown_generator=md_generator,
-                    scraping_strategy=LXMLWebScrapingStrategy(),
-                    cache_mode=cache_mode
-                )
+        from crawler_pool import get_crawler
+        crawler = await get_crawler(BrowserConfig())
+        result = await crawler.arun(
+            url=decoded_url,
+            config=CrawlerRunConfig(
+                markdown_generator=md_generator,
+                scraping_strategy=LXMLWebScrapingStrategy(),
+                cache_mode=cache_mode
             )
-            
-            if not result.success:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error_message
-                )
+        )
 
-            return (result.markdown.raw_markdown 
-                   if filter_type == FilterType.RAW 
-                   else result.markdown.fit_markdown)
+        if not result.success:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error_message
+            )
+
+        return (result.markdown.raw_markdown 
+               if filter_type == FilterType.RAW 
+               else result.markdown.fit_markdown)
 
     except Exception as e:
         logger.error(f"Markdown error: {str(e)}", exc_info=True)
@@ -294,7 +308,7 @@ async def handle_task_status(
         if not keep and should_cleanup_task(task["created_at"]):
             await redis.delete(f"task:{task_id}")
 
-    return JSONResponse(response)
+    return FastJSONResponse(response)
 
 async def create_new_task(
     redis: aioredis.Redis,
@@ -307,9 +321,7 @@ async def create_new_task(
     config: dict
 ) -> JSONResponse:
     """Create and initialize a new task."""
-    decoded_url = unquote(input_path)
-    if not decoded_url.startswith(('http://', 'https://')):
-        decoded_url = 'https://' + decoded_url
+    decoded_url = ensure_scheme(unquote(input_path))
 
     from datetime import datetime
     task_id = f"llm_{int(datetime.now().timestamp())}_{id(background_tasks)}"
@@ -355,7 +367,9 @@ def create_task_response(task: dict, task_id: str, base_url: str) -> dict:
     }
 
     if task["status"] == TaskStatus.COMPLETED:
-        response["result"] = json.loads(task["result"])
+        # Stored already serialised by dumps_json: splice it into the response
+        # as-is instead of parsing it into objects only to encode them again
+        response["result"] = orjson.Fragment(task["result"])
     elif task["status"] == TaskStatus.FAILED:
         response["error"] = task["error"]
 
@@ -363,27 +377,19 @@ def create_task_response(task: dict, task_id: str, base_url: str) -> dict:
 
 async def stream_results(crawler: AsyncWebCrawler, results_gen: AsyncGenerator) -> AsyncGenerator[bytes, None]:
     """Stream results with heartbeats and completion markers."""
-    import json
-    from utils import datetime_handler
-
     try:
         async for result in results_gen:
             try:
-                server_memory_mb = _get_memory_mb()
-                result_dict = result.model_dump()
-                result_dict['server_memory_mb'] = server_memory_mb
-                # If PDF exists, encode it to base64
-                if result_dict.get('pdf') is not None:
-                    result_dict['pdf'] = b64encode(result_dict['pdf']).decode('utf-8')
+                result_dict = _result_to_dict(result)
+                result_dict['server_memory_mb'] = _get_memory_mb()
                 logger.info(f"Streaming result for {result_dict.get('url', 'unknown')}")
-                data = json.dumps(result_dict, default=datetime_handler) + "\n"
-                yield data.encode('utf-8')
+                yield dumps_json(result_dict) + b"\n"
             except Exception as e:
                 logger.error(f"Serialization error: {e}")
                 error_response = {"error": str(e), "url": getattr(result, 'url', 'unknown')}
-                yield (json.dumps(error_response) + "\n").encode('utf-8')
+                yield dumps_json(error_response) + b"\n"
 
-        yield json.dumps({"status": "completed"}).encode('utf-8')
+        yield dumps_json({"status": "completed"})
         
     except asyncio.CancelledError:
         logger.warning("Client disconnected during streaming")
@@ -407,7 +413,7 @@ async def handle_crawl_request(
     peak_mem_mb = start_mem_mb
     
     try:
-        urls = [('https://' + url) if not url.startswith(('http://', 'https://')) else url for url in urls]
+        urls = [ensure_scheme(url) for url in urls]
         browser_config = BrowserConfig.load(browser_config)
         crawler_config = CrawlerRunConfig.load(crawler_config)
 
@@ -449,13 +455,7 @@ async def handle_crawl_request(
         logger.info(f"Memory usage: Start: {start_mem_mb} MB, End: {end_mem_mb} MB, Delta: {mem_delta_mb} MB, Peak: {peak_mem_mb} MB")
 
         # Process results to handle PDF bytes
-        processed_results = []
-        for result in results:
-            result_dict = result.model_dump()
-            # If PDF exists, encode it to base64
-            if result_dict.get('pdf') is not None:
-                result_dict['pdf'] = b64encode(result_dict['pdf']).decode('utf-8')
-            processed_results.append(result_dict)
+        processed_results = [_result_to_dict(result) for result in results]
             
         return {
             "success": True,
@@ -571,7 +571,7 @@ async def handle_crawl_job(
             )
             await redis.hset(f"task:{task_id}", mapping={
                 "status": TaskStatus.COMPLETED,
-                "result": json.dumps(result),
+                "result": dumps_json(result),
             })
             await asyncio.sleep(5)  # Give Redis time to process the update
         except Exception as exc:
@@ -1,9 +1,8 @@
 # crawler_pool.py  (new file)
-import asyncio, json, hashlib, time, psutil
+import asyncio, json, hashlib, os, time, psutil
 from contextlib import suppress
 from typing import Dict
 from crawl4ai import AsyncWebCrawler, BrowserConfig
-from typing import Dict
 from utils import load_config 
 
 CONFIG = load_config()
@@ -11,26 +10,36 @@ CONFIG = load_config()
 POOL: Dict[str, AsyncWebCrawler] = {}
 LAST_USED: Dict[str, float] = {}
 LOCK = asyncio.Lock()
+START_LOCKS: Dict[str, asyncio.Lock] = {}   # one per signature: concurrent cold requests share a single launch
 
 MEM_LIMIT  = CONFIG.get("crawler", {}).get("memory_threshold_percent", 95.0)   # % RAM – refuse new browsers above this
 IDLE_TTL  = CONFIG.get("crawler", {}).get("pool", {}).get("idle_ttl_sec", 1800)   # close if unused for 30 min
+CDP_URL   = os.getenv("CRAWL4AI_CDP_URL") or CONFIG.get("crawler", {}).get("browser", {}).get("cdp_url")   # attach every browser to one shared Chromium
 
 def _sig(cfg: BrowserConfig) -> str:
     payload = json.dumps(cfg.to_dict(), sort_keys=True, separators=(",",":"))
     return hashlib.sha1(payload.encode()).hexdigest()
 
 async def get_crawler(cfg: BrowserConfig) -> AsyncWebCrawler:
+    if CDP_URL and not cfg.cdp_url:
+        cfg = cfg.clone(cdp_url=CDP_URL)
     try:
         sig = _sig(cfg)
-        async with LOCK:
+        if sig in POOL:
+            LAST_USED[sig] = time.time()
+            return POOL[sig]
+        # Only requests for the same config wait on a launch; pool hits and
+        # other configs are not held up behind it.
+        async with START_LOCKS.setdefault(sig, asyncio.Lock()):
             if sig in POOL:
-                LAST_USED[sig] = time.time();  
+                LAST_USED[sig] = time.time()
                 return POOL[sig]
             if psutil.virtual_memory().percent >= MEM_LIMIT:
                 raise MemoryError("RAM pressure – new browser denied")
             crawler = AsyncWebCrawler(config=cfg, thread_safe=False)
             await crawler.start()
-            POOL[sig] = crawler; LAST_USED[sig] = time.time()
+            async with LOCK:
+                POOL[sig] = crawler; LAST_USED[sig] = time.time()
             return crawler
     except MemoryError as e:
         raise MemoryError(f"RAM pressure – new browser denied: {e}")
@@ -56,5 +65,6 @@ async def janitor():
         async with LOCK:
             for sig, crawler in list(POOL.items()):
                 if now - LAST_USED[sig] > IDLE_TTL:
+                    # unpublish before closing so get_crawler's lock-free hit path can't return it
+                    POOL.pop(sig, None); LAST_USED.pop(sig, None); START_LOCKS.pop(sig, None)
                     with suppress(Exception): await crawler.close()
-                    POOL.pop(sig, None); LAST_USED.pop(sig, None)
@@ -0,0 +1,14 @@
+# deploy/docker/gunicorn_worker.py
+"""
+Uvicorn worker used by gunicorn (see supervisord.conf).
+
+Gunicorn never runs server.py's __main__ block, so uvicorn settings the
+container needs have to live on the worker class.
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class Crawl4AIUvicornWorker(UvicornWorker):
+    # MCP WebSocket frames carry whole crawl results; per-message deflate costs
+    # a zlib pass per frame plus compressor state held for every connection
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "ws_per_message_deflate": False}
@@ -17,6 +17,8 @@ import mcp.types as t
 from mcp.server.lowlevel.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 
+from utils import dumps_json
+
 # ── opt‑in decorators ───────────────────────────────────────────
 def mcp_resource(name: str | None = None):
     def deco(fn):
@@ -37,7 +39,15 @@ def mcp_tool(name: str | None = None):
     return deco
 
 # ── HTTP‑proxy helper for FastAPI endpoints ─────────────────────
-def _make_http_proxy(base_url: str, route):
+def create_http_client() -> httpx.AsyncClient:
+    """Pooled client for tool calls; the app lifespan owns and closes it."""
+    # every tool call targets the same host, so keep one pooled client
+    # alive instead of paying a DNS lookup + TCP handshake per call
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+    )
+
+def _make_http_proxy(app: FastAPI, base_url: str, route):
     method = list(route.methods - {"HEAD", "OPTIONS"})[0]
     async def proxy(**kwargs):
         # replace `/items/{id}` style params first
@@ -49,18 +59,18 @@ def _make_http_proxy(base_url: str, route):
                 kwargs.pop(k)
         url = base_url.rstrip("/") + path
 
-        async with httpx.AsyncClient() as client:
-            try:
-                r = (
-                    await client.get(url, params=kwargs)
-                    if method == "GET"
-                    else await client.request(method, url, json=kwargs)
-                )
-                r.raise_for_status()
-                return r.text if method == "GET" else r.json()
-            except httpx.HTTPStatusError as e:
-                # surface FastAPI error details instead of plain 500
-                raise HTTPException(e.response.status_code, e.response.text)
+        client: httpx.AsyncClient = app.state.mcp_http_client
+        try:
+            r = (
+                await client.get(url, params=kwargs)
+                if method == "GET"
+                else await client.request(method, url, json=kwargs)
+            )
+            r.raise_for_status()
+            return r.text if method == "GET" else r.json()
+        except httpx.HTTPStatusError as e:
+            # surface FastAPI error details instead of plain 500
+            raise HTTPException(e.response.status_code, e.response.text)
     return proxy
 
 # ── main entry point ────────────────────────────────────────────
@@ -71,7 +81,11 @@ def attach_mcp(
     name: str | None = None,
     base_url: str,              # eg. "http://127.0.0.1:8020"
 ) -> None:
-    """Call once after all routes are declared to expose WS+SSE MCP endpoints."""
+    """Call once after all routes are declared to expose WS+SSE MCP endpoints.
+
+    Tool calls go through ``app.state.mcp_http_client``; the app lifespan
+    must set it to a ``create_http_client()`` instance and close it.
+    """
     server_name = name or app.title or "FastAPI-MCP"
     mcp = Server(server_name)
 
@@ -92,7 +106,7 @@ def attach_mcp(
         # if kind == "tool":
         #     tools[key] = _make_http_proxy(base_url, route)
         if kind == "tool":
-            proxy = _make_http_proxy(base_url, route)
+            proxy = _make_http_proxy(app, base_url, route)
             tools[key] = (proxy, fn)
             continue
         if kind == "resource":
@@ -136,7 +150,13 @@ def attach_mcp(
             # map server‑side errors into MCP "text/error" payloads
             err = {"error": exc.status_code, "detail": exc.detail}
             return [t.TextContent(type = "text", text=json.dumps(err))]
-        return [t.TextContent(type = "text", text=json.dumps(res, default=str))]
+        # tool results are whole crawl payloads (html/markdown): encode with orjson,
+        # falling back to str() for anything it can't (objects, >64-bit ints)
+        try:
+            text = dumps_json(res).decode()
+        except TypeError:
+            text = json.dumps(res, default=str)
+        return [t.TextContent(type = "text", text=text)]
 
     @mcp.list_resources()
     async def _list_resources() -> List[t.Resource]:
@@ -191,7 +211,7 @@ def attach_mcp(
             first = True 
             try:
                 async for msg in s2c_recv:
-                    await ws.send_json(msg.model_dump())
+                    await ws.send_text(dumps_json(msg.model_dump()).decode())
                     if first:
                         init_done.set()
                         first = False
@@ -204,12 +224,13 @@ def attach_mcp(
         async def ws_to_srv():
             try:
                 # 1st frame is always "initialize"
-                first = adapter.validate_python(await ws.receive_json())
+                # validate_json parses the raw frame in pydantic-core, no json.loads dict
+                first = adapter.validate_json(await ws.receive_text())
                 await c2s_send.send(first)
                 await init_done.wait()          # block until server ready
                 while True:
-                    data = await ws.receive_json()
-                    await c2s_send.send(adapter.validate_python(data))
+                    data = await ws.receive_text()
+                    await c2s_send.send(adapter.validate_json(data))
             except WebSocketDisconnect:
                 await c2s_send.aclose()
 
@@ -22,6 +22,7 @@ class RawCode(BaseModel):
 
 class HTMLRequest(BaseModel):
     url: str
+    c:   Optional[str] = Field("0", description="Set to \"1\" to serve repeat URLs from the crawl cache")
     
 class ScreenshotRequest(BaseModel):
     url: str
@@ -8,7 +8,7 @@ Crawl4AI FastAPI entry‑point
 
 # ── stdlib & 3rd‑party imports ───────────────────────────────
 from crawler_pool import get_crawler, close_all, janitor
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 from auth import create_access_token, get_token_dependency, TokenRequest
 from pydantic import BaseModel
 from typing import Optional, List, Dict
@@ -16,7 +16,6 @@ from fastapi import Request, Depends
 from fastapi.responses import FileResponse
 import base64
 import re
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 from api import (
     handle_markdown_request, handle_llm_qa,
     handle_stream_crawl_request, handle_crawl_request,
@@ -33,18 +32,19 @@ from schemas import (
 )
 
 from utils import (
-    FilterType, load_config, setup_logging, verify_email_domain
+    FilterType, load_config, setup_logging, verify_email_domain,
+    write_bytes_chunked, write_b64_chunked, get_memory_limit,
+    HTTP_PREFIXES, ensure_scheme, FastJSONResponse
 )
 import os
 import sys
 import time
 import asyncio
-from typing import List
 from contextlib import asynccontextmanager
 import pathlib
 
 from fastapi import (
-    FastAPI, HTTPException, Request, Path, Query, Depends
+    FastAPI, HTTPException, Path, Query
 )
 from rank_bm25 import BM25Okapi
 from fastapi.responses import (
@@ -55,11 +55,11 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.staticfiles import StaticFiles
 from job import init_job_router
 
-from mcp_bridge import attach_mcp, mcp_resource, mcp_template, mcp_tool
+from mcp_bridge import attach_mcp, create_http_client, mcp_resource, mcp_template, mcp_tool
 
 import ast
 import crawl4ai as _c4
-from pydantic import BaseModel, Field
+from pydantic import Field
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -76,6 +76,9 @@ __version__ = "0.5.1-d1"
 
 # ── global page semaphore (hard cap) ─────────────────────────
 MAX_PAGES = config["crawler"]["pool"].get("max_pages", 30)
+PAGE_MEM_MB = config["crawler"]["pool"].get("page_mem_mb", 0)   # 0 → no RAM-based cap
+if PAGE_MEM_MB:
+    MAX_PAGES = max(1, min(MAX_PAGES, get_memory_limit() // (PAGE_MEM_MB * 1024 * 1024)))
 GLOBAL_SEM = asyncio.Semaphore(MAX_PAGES)
 
 # import logging
@@ -103,13 +106,20 @@ AsyncWebCrawler.arun = capped_arun
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    await get_crawler(BrowserConfig(
+    # Chromium is baked into the image, so warm-up is only browser launches;
+    # start them together rather than one after the other
+    warmups = [get_crawler(BrowserConfig(
         extra_args=config["crawler"]["browser"].get("extra_args", []),
         **config["crawler"]["browser"].get("kwargs", {}),
-    ))           # warm‑up
+    ))]
+    if config["crawler"]["pool"].get("warm_default_browser", True):
+        warmups.append(get_crawler(BrowserConfig()))   # /html, /screenshot, /pdf, /execute_js browser
+    await asyncio.gather(*warmups)
+    app.state.mcp_http_client = create_http_client()          # MCP tool proxy
     app.state.janitor = asyncio.create_task(janitor())        # idle GC
     yield
     app.state.janitor.cancel()
+    await app.state.mcp_http_client.aclose()
     await close_all()
 
 # ───────────────────── FastAPI instance ──────────────────────
@@ -237,7 +247,7 @@ async def get_markdown(
     body: MarkdownRequest,
     _td: Dict = Depends(token_dep),
 ):
-    if not body.url.startswith(("http://", "https://")):
+    if not body.url.startswith(HTTP_PREFIXES):
         raise HTTPException(
             400, "URL must be absolute and start with http/https")
     markdown = await handle_markdown_request(
@@ -265,9 +275,11 @@ async def generate_html(
     Crawls the URL, preprocesses the raw HTML for schema extraction, and returns the processed HTML.
     Use when you need sanitized HTML structures for building schemas or further processing.
     """
-    cfg = CrawlerRunConfig()
-    async with AsyncWebCrawler(config=BrowserConfig()) as crawler:
-        results = await crawler.arun(url=body.url, config=cfg)
+    cfg = CrawlerRunConfig(
+        cache_mode=CacheMode.ENABLED if body.c == "1" else CacheMode.WRITE_ONLY
+    )
+    crawler = await get_crawler(BrowserConfig())
+    results = await crawler.arun(url=body.url, config=cfg)
     raw_html = results[0].html
     from crawl4ai.utils import preprocess_html_for_schema
     processed_html = preprocess_html_for_schema(raw_html)
@@ -291,14 +303,14 @@ async def generate_screenshot(
     """
     cfg = CrawlerRunConfig(
         screenshot=True, screenshot_wait_for=body.screenshot_wait_for)
-    async with AsyncWebCrawler(config=BrowserConfig()) as crawler:
-        results = await crawler.arun(url=body.url, config=cfg)
+    crawler = await get_crawler(BrowserConfig())
+    results = await crawler.arun(url=body.url, config=cfg)
     screenshot_data = results[0].screenshot
+    del results
     if body.output_path:
         abs_path = os.path.abspath(body.output_path)
-        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
-        with open(abs_path, "wb") as f:
-            f.write(base64.b64decode(screenshot_data))
+        # disk I/O off the event loop: multi-MB payloads would stall other requests
+        await asyncio.to_thread(write_b64_chunked, abs_path, screenshot_data)
         return {"success": True, "path": abs_path}
     return {"success": True, "screenshot": screenshot_data}
 
@@ -319,14 +331,13 @@ async def generate_pdf(
     Then in result instead of the PDF you will get a path to the saved file.
     """
     cfg = CrawlerRunConfig(pdf=True)
-    async with AsyncWebCrawler(config=BrowserConfig()) as crawler:
-        results = await crawler.arun(url=body.url, config=cfg)
+    crawler = await get_crawler(BrowserConfig())
+    results = await crawler.arun(url=body.url, config=cfg)
     pdf_data = results[0].pdf
+    del results
     if body.output_path:
         abs_path = os.path.abspath(body.output_path)
-        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
-        with open(abs_path, "wb") as f:
-            f.write(pdf_data)
+        await asyncio.to_thread(write_bytes_chunked, abs_path, pdf_data)
         return {"success": True, "path": abs_path}
     return {"success": True, "pdf": base64.b64encode(pdf_data).decode()}
 
@@ -385,11 +396,11 @@ async def execute_js(
 
     """
     cfg = CrawlerRunConfig(js_code=body.scripts)
-    async with AsyncWebCrawler(config=BrowserConfig()) as crawler:
-        results = await crawler.arun(url=body.url, config=cfg)
+    crawler = await get_crawler(BrowserConfig())
+    results = await crawler.arun(url=body.url, config=cfg)
     # Return JSON-serializable dict of the first CrawlResult
     data = results[0].model_dump()
-    return JSONResponse(data)
+    return FastJSONResponse(data)
 
 
 @app.get("/llm/{url:path}")
@@ -401,8 +412,7 @@ async def llm_endpoint(
 ):
     if not q:
         raise HTTPException(400, "Query parameter 'q' is required")
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
+    url = ensure_scheme(url)
     answer = await handle_llm_qa(url, q, config)
     return JSONResponse({"answer": answer})
 
@@ -443,7 +453,7 @@ async def crawl(
         crawler_config=crawl_request.crawler_config,
         config=config,
     )
-    return JSONResponse(res)
+    return FastJSONResponse(res)
 
 
 @app.post("/crawl/stream")
@@ -614,5 +624,9 @@ if __name__ == "__main__":
         port=config["app"]["port"],
         reload=config["app"]["reload"],
         timeout_keep_alive=config["app"]["timeout_keep_alive"],
+        loop="auto",        # picks uvloop when installed (not on Windows)
+        # MCP WebSocket frames carry whole crawl results; per-message deflate costs
+        # a zlib pass per frame plus compressor state held for every connection
+        ws_per_message_deflate=False,
     )
 # ─────────────────────────────────────────────────────────────
@@ -1,10 +1,14 @@
+import base64
 import dns.resolver
 import logging
+import orjson
+import psutil
 import yaml
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from fastapi import Request
+from fastapi.responses import JSONResponse
 from typing import Dict, Optional
 
 class TaskStatus(str, Enum):
@@ -35,6 +39,12 @@ def get_base_url(request: Request) -> str:
     """Get base URL including scheme and host."""
     return f"{request.url.scheme}://{request.url.netloc}"
 
+HTTP_PREFIXES = ("http://", "https://")
+
+def ensure_scheme(url: str) -> str:
+    """Prefix a bare host/path with https://; absolute http(s) URLs pass through unchanged."""
+    return url if url.startswith(HTTP_PREFIXES) else "https://" + url
+
 def is_task_id(value: str) -> bool:
     """Check if the value matches task ID pattern."""
     return value.startswith("llm_") and "_" in value
@@ -45,6 +55,15 @@ def datetime_handler(obj: any) -> Optional[str]:
         return obj.isoformat()
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
+def dumps_json(obj: any) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson (non-str keys allowed, like json.dumps)."""
+    return orjson.dumps(obj, default=datetime_handler, option=orjson.OPT_NON_STR_KEYS)
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson; crawl results carry large HTML/markdown strings."""
+    def render(self, content: any) -> bytes:
+        return dumps_json(content)
+
 def should_cleanup_task(created_at: str, ttl_seconds: int = 3600) -> bool:
     """Check if task should be cleaned up based on creation time."""
     created = datetime.fromisoformat(created_at)
@@ -54,6 +73,35 @@ def decode_redis_hash(hash_data: Dict[bytes, bytes]) -> Dict[str, str]:
     """Decode Redis hash data from bytes to strings."""
     return {k.decode('utf-8'): v.decode('utf-8') for k, v in hash_data.items()}
 
+def get_memory_limit() -> int:
+    """Usable RAM in bytes: the container's cgroup limit if set, else total system memory."""
+    total = psutil.virtual_memory().total
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            raw = Path(path).read_text().strip()
+        except OSError:
+            continue
+        if raw.isdigit():
+            return min(int(raw), total)   # v1 reports a huge number when unlimited
+    return total
+
+WRITE_CHUNK_SIZE = 64 * 1024  # multiple of 4 so base64 chunks decode cleanly
+
+def write_bytes_chunked(path: str, data: bytes, chunk_size: int = WRITE_CHUNK_SIZE) -> None:
+    """Write a binary payload to disk in slices of a memoryview (no intermediate copies)."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    view = memoryview(data)
+    with open(path, "wb", buffering=0) as f:
+        for i in range(0, len(view), chunk_size):
+            f.write(view[i:i + chunk_size])
+
+def write_b64_chunked(path: str, data: str, chunk_size: int = WRITE_CHUNK_SIZE) -> None:
+    """Decode a base64 string straight to disk without materialising the full decoded blob."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        for i in range(0, len(data), chunk_size):
+            f.write(base64.b64decode(data[i:i + chunk_size]))
+
 
 
 def verify_email_domain(email: str) -> bool:
@@ -0,0 +1,34 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from crawl4ai import BrowserConfig
+from crawl4ai.browser_manager import BrowserManager
+
+
+class TestBrowserManagerClose(unittest.TestCase):
+
+    def test_failed_session_close_is_logged_and_others_still_close(self):
+        logger = mock.Mock()
+        manager = BrowserManager(BrowserConfig(), logger=logger)
+        broken_page = mock.Mock(close=mock.AsyncMock(side_effect=RuntimeError("target closed")))
+        page = mock.Mock(close=mock.AsyncMock())
+        context = mock.Mock(close=mock.AsyncMock())
+        manager.sessions = {
+            "broken": (mock.Mock(close=mock.AsyncMock()), broken_page, time.time()),
+            "ok": (context, page, time.time()),
+        }
+
+        asyncio.run(manager.close())
+
+        page.close.assert_awaited_once()
+        context.close.assert_awaited_once()
+        self.assertEqual(manager.sessions, {})
+        logger.error.assert_called_once()
+        self.assertEqual(logger.error.call_args.kwargs["params"]["session_id"], "broken")
+        self.assertIn("target closed", logger.error.call_args.kwargs["params"]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
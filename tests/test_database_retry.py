@@ -0,0 +1,75 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from crawl4ai.async_database import AsyncDatabaseManager, _is_transient_sqlite_error
+
+
+class TestSqliteErrorClassification(unittest.TestCase):
+
+    def test_locked_and_busy_are_transient(self):
+        self.assertTrue(_is_transient_sqlite_error(sqlite3.OperationalError("database is locked")))
+        self.assertTrue(_is_transient_sqlite_error(sqlite3.OperationalError("database table is locked")))
+
+    def test_schema_errors_are_not_transient(self):
+        self.assertFalse(_is_transient_sqlite_error(sqlite3.OperationalError("no such table: crawled_data")))
+        self.assertFalse(_is_transient_sqlite_error(sqlite3.OperationalError("no such column: foo")))
+
+    def test_real_schema_error_from_sqlite(self):
+        conn = sqlite3.connect(":memory:")
+        with self.assertRaises(sqlite3.OperationalError) as ctx:
+            conn.execute("SELECT * FROM missing_table")
+        self.assertFalse(_is_transient_sqlite_error(ctx.exception))
+
+
+class TestExecuteWithRetry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = AsyncDatabaseManager(max_retries=3)
+        self.manager.db_path = os.path.join(self.tmp.name, "crawl4ai.db")
+        asyncio.run(self.manager.ainit_db())
+        self.manager._initialized = True
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, operation):
+        with mock.patch("crawl4ai.async_database.asyncio.sleep", new=mock.AsyncMock()) as sleep:
+            try:
+                return asyncio.run(self.manager.execute_with_retry(operation)), sleep
+            except Exception as e:
+                return e, sleep
+
+    def test_schema_error_fails_without_retrying(self):
+        calls = []
+
+        async def operation(db):
+            calls.append(1)
+            await db.execute("SELECT * FROM missing_table")
+
+        error, sleep = self._run(operation)
+        self.assertIsInstance(error, sqlite3.OperationalError)
+        self.assertEqual(len(calls), 1)
+        sleep.assert_not_called()
+
+    def test_locked_error_is_retried(self):
+        calls = []
+
+        async def operation(db):
+            calls.append(1)
+            if len(calls) < 3:
+                raise sqlite3.OperationalError("database is locked")
+            return "ok"
+
+        result, sleep = self._run(operation)
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sleep.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+
+from crawl4ai import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy, HTTPCrawlerError
+
+BODY = b"<html><body>" + b"x" * 200_000 + b"</body></html>"
+
+
+async def _fixed(request):
+    return web.Response(body=BODY, content_type="text/html")
+
+
+async def _streamed(request):
+    # chunked: no Content-Length, so only the streamed read can catch it
+    response = web.StreamResponse(headers={"Content-Type": "text/html"})
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    for i in range(0, len(BODY), 16_384):
+        await response.write(BODY[i:i + 16_384])
+    await response.write_eof()
+    return response
+
+
+class TestHTTPResponseSizeLimit(unittest.TestCase):
+
+    def _crawl(self, path, **strategy_kwargs):
+        async def run():
+            app = web.Application()
+            app.router.add_get("/fixed", _fixed)
+            app.router.add_get("/streamed", _streamed)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                async with AsyncHTTPCrawlerStrategy(**strategy_kwargs) as strategy:
+                    return await strategy.crawl(
+                        f"http://127.0.0.1:{port}{path}", CrawlerRunConfig()
+                    )
+            finally:
+                await runner.cleanup()
+
+        return asyncio.run(run())
+
+    def test_no_limit_by_default(self):
+        for path in ("/fixed", "/streamed"):
+            result = self._crawl(path)
+            self.assertEqual(len(result.html), len(BODY))
+
+    def test_content_length_over_limit_is_rejected(self):
+        with self.assertRaises(HTTPCrawlerError) as ctx:
+            self._crawl("/fixed", max_response_size=100_000)
+        self.assertIn("limit", str(ctx.exception))
+
+    def test_streamed_body_over_limit_is_rejected(self):
+        with self.assertRaises(HTTPCrawlerError) as ctx:
+            self._crawl("/streamed", max_response_size=100_000)
+        self.assertIn("exceeded", str(ctx.exception))
+
+    def test_body_under_limit_is_returned(self):
+        for path in ("/fixed", "/streamed"):
+            result = self._crawl(path, max_response_size=len(BODY))
+            self.assertEqual(len(result.html), len(BODY))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from crawl4ai import install
+
+
+class TestInstallSentinel(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        env = {"CRAWL4_AI_BASE_DIRECTORY": self.tmp.name, "CRAWL4AI_MODE": "api"}
+        self.env = mock.patch.dict(os.environ, env)
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def _post_install(self, migration_ok=True):
+        with mock.patch.object(install, "run_migration", return_value=migration_ok) as run_migration:
+            install.post_install()
+        return run_migration
+
+    def test_first_install_migrates_and_writes_sentinel(self):
+        self._post_install().assert_called_once()
+        self.assertTrue(install._install_sentinel().exists())
+
+    def test_failed_migration_leaves_no_sentinel(self):
+        self._post_install(migration_ok=False).assert_called_once()
+        self.assertFalse(install._install_sentinel().exists())
+
+    def test_sentinel_and_database_skip_migration(self):
+        sentinel = install._install_sentinel()
+        sentinel.touch()
+        (sentinel.parent / "crawl4ai.db").touch()
+        self._post_install().assert_not_called()
+
+    def test_sentinel_without_database_migrates_again(self):
+        install._install_sentinel().touch()
+        self._post_install().assert_called_once()
+
+    def test_sentinel_name_carries_the_version(self):
+        from crawl4ai.__version__ import __version__
+        self.assertEqual(install._install_sentinel().name, f".installed_v{__version__}")
+
+
+if __name__ == "__main__":
+    unittest.main()
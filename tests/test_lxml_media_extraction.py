@@ -0,0 +1,35 @@
+import unittest
+from crawl4ai import LXMLWebScrapingStrategy
+
+PAGE_URL = "https://example.com/page"
+HTML = """
+<html><body>
+  <p>Intro text for the page here.</p>
+  <a href="https://ads.example.org/x"><img src="https://ads.example.org/banner.png" alt="ad"></a>
+  <a href="/in">in</a>
+  <img src="/local.png" alt="local">
+  <video src="/v.mp4"></video>
+  <a href="https://ads.example.org/y"><video src="https://ads.example.org/v.mp4"></video></a>
+</body></html>
+"""
+
+
+class TestLXMLMediaExtraction(unittest.TestCase):
+
+    def test_media_inside_excluded_external_link_is_dropped(self):
+        result = LXMLWebScrapingStrategy().scrap(PAGE_URL, HTML, exclude_external_links=True)
+        self.assertEqual([img.src for img in result.media.images], ["/local.png"])
+        self.assertEqual([video.src for video in result.media.videos], ["/v.mp4"])
+        self.assertEqual(result.links.external, [])
+
+    def test_media_inside_kept_external_link_is_reported(self):
+        result = LXMLWebScrapingStrategy().scrap(PAGE_URL, HTML)
+        self.assertIn("https://ads.example.org/banner.png", [img.src for img in result.media.images])
+        self.assertEqual(
+            [video.src for video in result.media.videos],
+            ["/v.mp4", "https://ads.example.org/v.mp4"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,3 @@
-import nest_asyncio
-
-nest_asyncio.apply()
-
 import asyncio
 from crawl4ai import (
     AsyncWebCrawler,
@@ -0,0 +1,27 @@
+import base64
+import unittest
+
+from PIL import Image
+
+from crawl4ai.async_crawler_strategy import JPEG_MAX_DIMENSION, _encode_stitched_screenshot
+
+
+class TestStitchedScreenshotEncoding(unittest.TestCase):
+
+    def test_regular_page_is_jpeg(self):
+        data = base64.b64decode(_encode_stitched_screenshot(Image.new("RGB", (64, 2000))))
+        self.assertTrue(data.startswith(b"\xff\xd8"))
+
+    def test_page_taller_than_jpeg_limit_falls_back_to_png(self):
+        image = Image.new("RGB", (8, JPEG_MAX_DIMENSION + 500))
+        data = base64.b64decode(_encode_stitched_screenshot(image))
+        self.assertTrue(data.startswith(b"\x89PNG"))
+
+    def test_height_at_jpeg_limit_is_jpeg(self):
+        image = Image.new("RGB", (8, JPEG_MAX_DIMENSION))
+        data = base64.b64decode(_encode_stitched_screenshot(image))
+        self.assertTrue(data.startswith(b"\xff\xd8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import asyncio
+import socket
+import time
+import unittest
+
+from aiohttp import web
+
+from crawl4ai import BrowserConfig
+from crawl4ai.browser_manager import ManagedBrowser
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestWaitForCdp(unittest.TestCase):
+
+    def setUp(self):
+        self.browser = ManagedBrowser(browser_config=BrowserConfig())
+
+    def _wait(self, handler, timeout):
+        async def run():
+            app = web.Application()
+            app.router.add_get("/json/version", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                start = time.monotonic()
+                await self.browser._wait_for_cdp(f"http://127.0.0.1:{port}", timeout=timeout)
+                return time.monotonic() - start
+            finally:
+                await runner.cleanup()
+
+        return asyncio.run(run())
+
+    def test_returns_as_soon_as_endpoint_answers(self):
+        async def ready(request):
+            return web.json_response({"Browser": "Chrome"})
+
+        self.assertLess(self._wait(ready, timeout=2.0), 1.0)
+
+    def test_polls_until_endpoint_is_ready(self):
+        calls = []
+
+        async def starting(request):
+            calls.append(1)
+            if len(calls) < 3:
+                return web.Response(status=503)
+            return web.json_response({"Browser": "Chrome"})
+
+        self.assertLess(self._wait(starting, timeout=2.0), 1.5)
+        self.assertEqual(len(calls), 3)
+
+    def test_gives_up_after_timeout_when_nothing_listens(self):
+        url = f"http://127.0.0.1:{_free_port()}"
+        start = time.monotonic()
+        asyncio.run(self.browser._wait_for_cdp(url, timeout=0.3))
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.3)
+        self.assertLess(elapsed, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()